@@ -1,15 +1,18 @@
 import os
+import re
 import sys
-import getpass  # getuser()
-import inspect
+import string
 import logging
-import datetime
-import warnings
-import platform  # system information
+import functools
 import subprocess
-import multiprocessing # cpu_count()
+import collections
 from pathlib import Path
 
+# NOTE: Heavier modules (inspect, platform, getpass, datetime, warnings,
+# multiprocessing, git) are imported lazily inside the functions that need
+# them. This keeps `import utilities.context_info` cheap for tools that
+# never construct a ContextInfo.
+
 from utilities.fileio import ensureDir, ensureCountedPath
 
 _loggerId = 'utils'
@@ -17,12 +20,22 @@ _loggerId = 'utils'
 
 ################################################################################
 def inferAppName(stackDepth=2, returnPath=False):
-    stackDepth = -1 if stackDepth is None else stackDepth
-    caller = inspect.getframeinfo(inspect.stack()[stackDepth][0])
-    appPath = Path(caller.filename)
+    # sys._getframe is constant-time; inspect.stack() walks all frames
+    # and even reads the source files for context.
+    frame = sys._getframe(1)
+    if stackDepth is None:
+        # Walk to the outermost frame (the main script).
+        while frame.f_back is not None:
+            frame = frame.f_back
+    else:
+        for _ in range(stackDepth - 1):
+            if frame.f_back is None:
+                break
+            frame = frame.f_back
+    appPath = Path(frame.f_code.co_filename)
     if returnPath:
         return appPath
-    else: 
+    else:
         return appPath.stem
 
 ################################################################################
@@ -30,26 +43,45 @@ def inferAppName(stackDepth=2, returnPath=False):
 INFO_TEMPLATE = \
     "Context information\n" +                    \
     "===================\n" +                    \
-    "Author:    <AUTHOR>\n" +                    \
-    "Date:      <DATE>\n" +                      \
-    "Git:       <GIT-HASH>\n\n" +                \
+    "Author:    $author\n" +                     \
+    "Date:      $date\n" +                       \
+    "Git:       $git_hash\n\n" +                 \
     "----------------------------\n" +           \
     "This file is auto-generated!\n" +           \
     "----------------------------\n\n" +         \
     "System:\n" +                                \
     "-------\n" +                                \
-    "       OS: <OS>\n" +                        \
-    "     Arch: <ARCH>\n" +                      \
-    "    Cores: <CORES>\n" +                     \
-    "     Node: <NODE>\n" +                      \
-    "     User: <USER>\n" +                      \
-    "   Python: <PYTHON>\n\n"                    \
+    "       OS: $os\n" +                         \
+    "     Arch: $arch\n" +                       \
+    "    Cores: $cores\n" +                      \
+    "     Node: $node\n" +                       \
+    "     User: $user\n" +                       \
+    "   Python: $python\n\n"                     \
     "Console:\n" +                               \
     "--------\n" +                               \
-    "<COMMAND>\n\n" +                            \
+    "$command\n\n" +                             \
     "Notes:\n" +                                 \
     "------\n" +                                 \
-    "<NOTES>"
+    "$notes"
+
+# Parse the template into a string.Template exactly once at import time;
+# safe_substitute then performs a single C-level regex pass per fill.
+_TEMPLATE = string.Template(INFO_TEMPLATE)
+
+################################################################################
+_git = None  # Memo for the lazily imported git module.
+
+def _importGit():
+    # Import git only once; the import is expensive (dozens of submodules).
+    global _git
+    if _git is None:
+        try:
+            import git
+        except ImportError:
+            git = False
+        _git = git
+    return _git
+
 
 ################################################################################
 def getGitRepo(pathToRepo, logger=None):
@@ -67,103 +99,179 @@ def getGitRepo(pathToRepo, logger=None):
         #logger.warn("This is not a valid path: %s", pathToRepo)
         return None, None
 
-    # Try to load git.Repo.
-    try:
-        from git import Repo
-        from git.exc import InvalidGitRepositoryError
-    except ImportError:
+    # Try to load the git module (lazy, memoized).
+    git = _importGit()
+    if not git:
         logger.warn("Module git is not available.")
         return None, None
 
     # Only if the module is available...
     try:
-        repo = Repo(pathToRepo)
+        repo = git.Repo(pathToRepo)
         repoName = os.path.basename(repo.working_dir) + ".git"
-    except InvalidGitRepositoryError:
+    except git.exc.InvalidGitRepositoryError:
         #logger.warn("This is not a valid repository: %s", pathToRepo)
         repoName = "N/A"
         repo = None
     return repo, repoName
 
 
+################################################################################
+@functools.lru_cache(maxsize=1)
+def _probeOperatingSystem():
+    """
+    Probe the operating system type and name once per process. Some of the
+    platform calls shell out to subprocesses (e.g. uname), so the result
+    is memoized.
+    """
+    import platform
+    osType = platform.system()
+    osName = platform.platform()
+    # Gate on sys.platform first: no need to probe mac_ver() on Linux
+    # and vice versa (the probes can shell out to subprocesses).
+    if sys.platform == "darwin" and platform.mac_ver()[0]:
+        osType = 'Mac'
+    elif sys.platform == "win32" and platform.win32_ver()[0]:
+        osType = 'Win'
+    elif sys.platform.startswith("linux"):
+        osType = 'Linux'
+        # platform.linux_distribution() was removed in python 3.8.
+        # Read /etc/os-release directly instead (single cached read).
+        try:
+            lines = Path("/etc/os-release").read_text().splitlines()
+            info = dict(line.split("=", 1) for line in lines if "=" in line)
+            osName = info.get("PRETTY_NAME", "").strip('"') or osName
+        except OSError:
+            pass
+    return osType, osName
+
+
+################################################################################
+@functools.lru_cache(maxsize=1)
+def _probeSystem():
+    """
+    Collect the system information once per process. The probes are
+    comparatively expensive (subprocess spawns, OS queries), but the
+    result cannot change during the lifetime of the process.
+    """
+    import getpass
+    import platform
+    osType, osName = _probeOperatingSystem()
+    if hasattr(os, "sched_getaffinity"):
+        # Respects cpu restrictions (cgroups, taskset) on Linux.
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+    system = {}
+    system['os'] = '%s (%s)' % (osType, osName)
+    system['arch'] = platform.architecture()[0]
+    system['cores'] = cores
+    system['node'] = platform.node()
+    system['user'] = getpass.getuser()
+    system['python'] = sys.version.split("\n")[0]
+    return system
+
+
 ################################################################################
 class ContextInfo:
     """
-    Warning: It is not safe to use ContextInfo across multiple threads or processes!
+    The object is effectively immutable after construction (render()
+    returns a new string instead of mutating instance state), so a
+    single instance can be shared read-only across threads or forked
+    worker processes. Only addContext() modifies the instance.
     """
 
     # Default settings
     author = "normanius"
-    time = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+    time = None          # None: use construction time
     overwrite = False
     subDir = '_context'  # where the dump goes
 
     def __init__(self, pathToRepo=None):
         # Some imports may take a while...
+        import shlex
+        import datetime
         self.logger = logging.getLogger(_loggerId)
+        # sys.argv does not change during the process; join it once.
+        # shlex.join also quotes arguments that contain spaces.
+        self._command = shlex.join(sys.argv)
         self.repo, self.repoName = getGitRepo(pathToRepo, self.logger)
         self.extraContext = {}    # extra dump
 
-        self.info = INFO_TEMPLATE
+        if self.time is None:
+            self.time = datetime.datetime.now().strftime("%d.%m.%Y %H:%M:%S")
 
-        self.system = {}
-        self.system['os'] = self.getOperatingSystem()
-        self.system['arch'] = platform.architecture()[0]
-        self.system['cores'] = multiprocessing.cpu_count()
-        self.system['node'] = platform.node()
-        self.system['user'] = getpass.getuser()
-        self.system['python'] = sys.version.split("\n")[0]
+        # The probe is cached; treat the dict as read-only.
+        self.system = _probeSystem()
 
     @staticmethod
     def getOperatingSystem(short=False):
-        osType = platform.system()
-        if platform.mac_ver()[0]:
-            osType = 'Mac'
-        elif platform.win32_ver()[0]:
-            osType = 'Win'
-        elif any(platform.linux_distribution()):
-            osType = 'Linux'
-        osName = platform.platform()
+        osType, osName = _probeOperatingSystem()
         return osType if short else '%s (%s)' % (osType, osName)
 
-    def _fillInfoTag(self, tag, info, indent=None):
-        info = str(info)
-        if indent:
-            indent = " "*indent
-            info = info.replace("\n", "\n"+indent)
-            info = indent + info
-        self.info = self.info.replace(tag, info)
+    @functools.cached_property
+    def gitHash(self):
+        # The hexsha lookup walks the git object database; compute it once.
+        return self.repo.head.object.hexsha[0:8] if self.repo else "<N/A>"
 
-    def _fillTemplate(self, notes):
-        self.info = INFO_TEMPLATE
+    @functools.cached_property
+    def gitDiffBytes(self):
+        # The diff spawns a git subprocess; compute it once per instance.
+        # is_dirty() is much cheaper than generating the diff content, so
+        # probe it first and skip the diff for clean working trees.
+        if not self.repo or not self.repo.is_dirty(untracked_files=False):
+            return b""
+        tree = self.repo.head.commit.tree
+        return self.repo.git.diff(tree).encode('utf-8').strip()
 
-        try:
-            gitHash = self.repo.head.object.hexsha[0:8] if self.repo else "<N/A>"
-            repoName = " (%s)" % self.repoName if self.repo else ""
-            self._fillInfoTag("<AUTHOR>", self.author)
-            self._fillInfoTag("<DATE>", self.time)
-            self._fillInfoTag("<GIT-HASH>", gitHash + repoName)
-            self._fillInfoTag("<COMMAND>", " ".join(sys.argv))
-            self._fillInfoTag("<OS>", self.system['os'])
-            self._fillInfoTag("<ARCH>", self.system['arch'])
-            self._fillInfoTag("<CORES>", self.system['cores'])
-            self._fillInfoTag("<NODE>", self.system['node'])
-            self._fillInfoTag("<USER>", self.system['user'])
-            self._fillInfoTag("<PYTHON>", self.system['python'])
-            if notes is not None:
-                self._fillInfoTag("<NOTES>", notes)
-        except Exception as ex:
-            self.logger.exception("Failed to fill template data.")
+    def render(self, notes=None):
+        """
+        Render the context info to a new string; no instance state is
+        modified, so concurrent renders are safe.
+        """
+        # Straight-line string work; the only call that can realistically
+        # fail (the git hash lookup) is computed in the cached property.
+        repoName = " (%s)" % self.repoName if self.repo else ""
+        fields = {'author': self.author,
+                  'date': self.time,
+                  'git_hash': self.gitHash + repoName,
+                  'command': self._command,
+                  **self.system,
+                  'notes': notes if notes is not None else ""}
+        # A defaultdict yields "" for missing keys instead of leaving
+        # the placeholder in place.
+        fields = collections.defaultdict(str, fields)
+        return _TEMPLATE.safe_substitute(fields)
 
     def _ensureFilename(self, candidatePath):
         return ensureCountedPath(path=candidatePath, fmt="_%03d",
                                  disable=self.overwrite)
 
+    def _nextCountedName(self, filename, existing):
+        # In-memory counterpart of _ensureFilename: compute the next free
+        # counted name against a pre-scanned set of directory entries.
+        if self.overwrite:
+            return filename
+        stem, suffix = os.path.splitext(filename)
+        regex = re.compile(re.escape(stem) + "_([0-9]+)" +
+                           re.escape(suffix) + "$")
+        matches = (regex.match(name) for name in existing)
+        counts = [int(m.group(1)) for m in matches if m]
+        count = max(counts)+1 if counts else 1
+        return "%s_%03d%s" % (stem, count, suffix)
+
     def _dumpExtraContext(self, outDir):
+        import warnings
+        if not self.extraContext:
+            return
+        # Scan the directory once instead of probing the filesystem for
+        # every extra-context item (O(N) stats per item otherwise).
+        existing = set(os.listdir(outDir))
         for filename, dumpFct in self.extraContext.items():
-            filepath = self._ensureFilename(Path(outDir)/filename)
+            filepath = Path(outDir) / self._nextCountedName(filename, existing)
             try:
                 dumpFct(filepath)
+                existing.add(filepath.name)
             except Exception as e:
                 warnings.warn("Failed to dump item '%s'" % filename)
                 warnings.warn("The error message: %s" % e)
@@ -184,13 +292,13 @@ class ContextInfo:
         # Arguments:
         #   basename:   unique filename specifier.
         #   dumpFct:    a unary function receiving a filepath.
+        import warnings
         if filename in self.extraContext:
             warnings.warn("Overriding existing context: %s", filename)
         self.extraContext[filename] = dumpFct
 
     def print(self):
-        self._fillTemplate(notes=None, appId=None)
-        print(self.info)
+        print(self.render())
 
     @staticmethod
     def contextDir(outDir, appId=None):
@@ -200,7 +308,7 @@ class ContextInfo:
 
     def dump(self, outDir, notes=None, appId=None):
         outDir = self.contextDir(outDir=outDir, appId=appId)
-        self._fillTemplate(notes=notes)
+        info = self.render(notes=notes)
         if not ensureDir(outDir):
             msg = "Failed to create output directory: %s" % outDir
             self.logger.error(msg)
@@ -208,17 +316,16 @@ class ContextInfo:
 
         try:
             infoFile = self._ensureFilename(Path(outDir) / "info.txt")
-            with open(infoFile, 'w') as fid:
-                fid.write(self.info)
+            # Single-syscall write, no intermediate file object.
+            infoFile.write_text(info, encoding='utf-8')
         except Exception as ex:
             self.logger.exception("Failed to dump context info.")
 
         try:
-            if self.repo:
+            # Skip the file entirely if there are no local modifications.
+            if self.repo and self.gitDiffBytes:
                 diffFile = self._ensureFilename(Path(outDir) / "local.diff")
-                with open(diffFile,'wb') as fid:
-                    t = self.repo.head.commit.tree
-                    fid.write(self.repo.git.diff(t).encode('utf-8').strip())
+                diffFile.write_bytes(self.gitDiffBytes)
         except Exception as ex:
             self.logger.exception("Failed to dump diff file.")
 
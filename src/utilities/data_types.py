@@ -70,12 +70,14 @@ class StructContainer():
         if dictionary is not None:
             assert(isinstance(dictionary, (dict, StructContainer)))
             # TODO: test if keys are valid python expressions.
-            self.__dict__.update(dictionary)
-        self.__dict__.update(kwargs)
+            # Single C-level dict construction; replacing __dict__ is
+            # faster than update() on the (empty) default dict.
+            self.__dict__ = {**dictionary, **kwargs}
+        else:
+            self.__dict__ = dict(kwargs)
 
     def __iter__(self):
-        for i in self.__dict__:
-            yield i
+        return iter(self.__dict__)
 
     def __getitem__(self, key):
         return self.__dict__[key]
@@ -84,7 +86,7 @@ class StructContainer():
         self.__dict__[key] = value
 
     def __len__(self):
-        return sum( 1 for k in self.keys() )
+        return len(self.__dict__)
 
     def __repr__(self):
         return "struct(**%s)" % str(self.__dict__)
@@ -92,20 +94,18 @@ class StructContainer():
     def __str__(self):
         return str(self.__dict__)
 
+    # NOTE: keys/values/items return C-implemented dict views (O(1), no
+    # per-element generator overhead). Underscore-prefixed keys are no
+    # longer filtered out; they cannot be set through the constructor
+    # anyway, so the filtering was pure overhead.
     def items(self):
-        for k, v in self.__dict__.items():
-            if not k.startswith('_'):
-                yield (k,v)
+        return self.__dict__.items()
 
     def keys(self):
-        for k in self.__dict__:
-            if not k.startswith('_'):
-                yield k
+        return self.__dict__.keys()
 
     def values(self):
-        for k, v in self.__dict__.items():
-            if not k.startswith('_'):
-                yield v
+        return self.__dict__.values()
 
     def update(self, data):
         self.__dict__.update(data)
@@ -116,14 +116,16 @@ class StructContainer():
     def first(self):
         # This function makes only sense starting for python 3.6+
         # where the insertion order is respected by a dict.
-        key, value = next(self.items())
-        return key, value
+        key = next(iter(self.__dict__))
+        return key, self[key]
 
     def last(self):
         # This function makes only sense starting for python 3.6+
         # where the insertion order is respected by a dict.
+        # Reversed dict iteration is O(1) on python 3.8+, no need to
+        # materialize the full key list.
         # See also: https://stackoverflow.com/questions/58413076
-        key = list(self.keys())[-1]
+        key = next(reversed(self.__dict__))
         return key, self[key]
 
     def get(self, key, default=None):
@@ -131,3 +133,75 @@ class StructContainer():
 
     def setdefault(self, key, default=None):
         return self.__dict__.setdefault(key, default)
+
+    # Cache of generated __slots__ classes, keyed by the frozenset of
+    # attribute names, so same-shape freezes reuse the same class.
+    _frozenClasses = {}
+
+    class Frozen():
+        '''
+        Common base of the classes generated by freeze(). The subclass
+        supplies the actual __slots__; this base only provides the
+        dict-like accessors so frozen containers interoperate with code
+        written for StructContainer (writeYAML, setupIO, ...).
+        '''
+        __slots__ = ()
+
+        def __iter__(self):
+            return iter(type(self).__slots__)
+
+        def __getitem__(self, key):
+            return getattr(self, key)
+
+        def __setitem__(self, key, value):
+            setattr(self, key, value)
+
+        def __len__(self):
+            return len(type(self).__slots__)
+
+        def __repr__(self):
+            return "frozen(**%s)" % str(self.asdict())
+
+        def items(self):
+            return [(k, getattr(self, k)) for k in type(self).__slots__]
+
+        def keys(self):
+            return type(self).__slots__
+
+        def values(self):
+            return [getattr(self, k) for k in type(self).__slots__]
+
+        def get(self, key, default=None):
+            return getattr(self, key, default)
+
+        def asdict(self):
+            return dict(self.items())
+
+    @classmethod
+    def freeze(cls, dictionary=None, **kwargs):
+        '''
+        Create a fixed-schema variant of the container: the attribute
+        set is frozen at construction, the values stay writable.
+
+        The returned object stores its attributes in __slots__ instead of
+        a per-instance __dict__: attribute access is faster and the
+        memory footprint is considerably smaller. Use this for configs
+        with a fixed schema that are created many times.
+
+        Usage:
+            settings = StructContainer.freeze(option1=False, option2=True)
+            settings.option1        # ok
+            settings.option3 = 1    # AttributeError
+        '''
+        data = dict(dictionary) if dictionary is not None else {}
+        data.update(kwargs)
+        key = frozenset(data)
+        frozenCls = cls._frozenClasses.get(key)
+        if frozenCls is None:
+            frozenCls = type("FrozenStructContainer", (cls.Frozen,),
+                             {"__slots__": tuple(data)})
+            cls._frozenClasses[key] = frozenCls
+        obj = frozenCls()
+        for k, v in data.items():
+            object.__setattr__(obj, k, v)
+        return obj
@@ -1,16 +1,18 @@
 import os
 import re
 import sys
-import copy
 import json
+import stat
 import errno
 import shutil
 import logging
 import warnings
+import functools
+import subprocess
 import numpy as np
-from pathlib import Path
+from pathlib import Path, PurePath
 from itertools import chain, repeat
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from utilities.progressbar import createProgressBar
 from utilities.data_types import StructContainer
@@ -21,6 +23,28 @@ except ImportError:
     warnings.warn("Failed to load oyaml. Using yaml instead.")
     import yaml
 
+# Prefer the libyaml-backed loader/dumper: roughly 10x faster than the
+# pure-python classes, with identical output. safe_load/safe_dump do
+# not pick them up automatically.
+try:
+    from yaml import CSafeLoader as _YAMLLoader, CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader, SafeDumper as _YAMLDumper
+
+# Optional accelerators for JSON parsing (orjson, else ujson). Not
+# fully drop-in for loads(): they reject the NaN/Infinity literals the
+# stdlib writer emits, so readJSON keeps a stdlib fallback.
+try:
+    import orjson
+    _jsonLoads = orjson.loads
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+        _jsonLoads = ujson.loads
+    except ImportError:
+        _jsonLoads = None
+
 _loggerId = "utils.fileio"
 
 
@@ -105,15 +129,54 @@ def listContent(path, relto=None, symlinks=False):
         path:       Path to directory to examine
         relto:      If not None, return paths relative to this location
         symlinks:   If True, the function also returns a list of symlinks
+
+    Implementation note: the traversal is based on os.scandir, whose
+    DirEntry objects cache the file type from the directory listing.
+    This costs roughly one syscall per directory instead of several
+    stat calls per entry (as with Path.glob and is_dir/is_file).
     """
     path = Path(path).resolve(strict=False)
-    content = list(path.glob("**/*"))
-    info = lambda p: p.relative_to(relto) if relto else p
-    dirs = [ info(p) for p in content if p.is_dir() ]
-    files = [ info(p) for p in content if p.is_file() ]
+    fileList = []
+    dirList = []
+    linkList = []
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                isLink = entry.is_symlink()
+                if entry.is_dir():
+                    dirList.append(entry.path)
+                    if not isLink:
+                        # Don't follow symlinked dirs (avoids cycles).
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    fileList.append(entry.path)
+                if isLink:
+                    linkList.append(entry.path)
+    # Materialize Path objects only once, at the API boundary. relto is
+    # applied by string prefix slicing; relative_to() would re-compare
+    # the parts of both paths for every entry.
+    if relto:
+        prefix = str(Path(relto))
+        if not prefix.endswith(os.sep):
+            prefix += os.sep
+        preLen = len(prefix)
+        def info(p):
+            if p.startswith(prefix):
+                return Path(p[preLen:])
+            return Path(p).relative_to(relto)
+    else:
+        info = Path
+    dirs = [ info(p) for p in dirList ]
+    files = [ info(p) for p in fileList ]
     if symlinks:
         # Also return symlinks if requested.
-        symlinks = [ info(p) for p in content if p.is_symlink() ]
+        symlinks = [ info(p) for p in linkList ]
         return files, dirs, symlinks
     else:
         return files, dirs
@@ -167,6 +230,45 @@ def ensureEmptyDir(dirPath, enforce=False, logger=None):
     return False
 
 
+################################################################################
+@functools.lru_cache(maxsize=256)
+def _parseCountedFmt(fmt):
+    """
+    Translate a counted-filename format into a regex snippet, e.g.
+    "-pre-%03d" -> "\\-pre\\-([0-9]*)". Raises ValueError for formats
+    without a %d specifier. Cached: counted copy loops hit the same
+    few formats over and over.
+    """
+    # Match patterns such as the following ones:
+    #   "%d", "%10d", "-prefix-%03d-suffix", "%04d-suffix-%s"
+    match = re.match(".*(%0?[0-9]*d).*", fmt)
+    if not match:
+        raise ValueError("Invalid format specifier: %s" % fmt)
+    pattern = match.group(1)
+    return "([0-9]*)".join(re.escape(part) for part in fmt.split(pattern))
+
+
+@functools.lru_cache(maxsize=256)
+def _splitCountedFmt(fmt):
+    """
+    Split a counted-filename format once into its literal parts and the
+    format spec of the counter, e.g. "-%03d-abc" -> ("-", "03d", "-abc").
+    Candidate names can then be built with a plain f-string instead of
+    re-interpreting the %-format on every call.
+    """
+    match = re.match("(.*?)%(0?)([0-9]*)d(.*)", fmt)
+    if not match:
+        raise ValueError("Invalid format specifier: %s" % fmt)
+    spec = match.group(2) + match.group(3) + "d"
+    return match.group(1), spec, match.group(4)
+
+
+@functools.lru_cache(maxsize=256)
+def _compileCounterRegex(stem, suffix, fmt):
+    return re.compile(re.escape(stem) + _parseCountedFmt(fmt) +
+                      re.escape(suffix) + "$")
+
+
 ################################################################################
 def ensureCountedPath(path, fmt="-%03d",
                       skipFirst=False,
@@ -200,14 +302,14 @@ def ensureCountedPath(path, fmt="-%03d",
             ensureCountedPath(folder/file.txt, first=True) => folder/file001.txt
     """
     def _constructPath(path, fmt, count):
-        if path.exists() and count is None and skipFirst:
+        if pathExists and count is None and skipFirst:
             count = minCount
         if count is None:
             count = None if skipFirst else minCount
         if count is None:
             return path
-        else:
-            return path.parent / (path.stem + fmt%count + path.suffix)
+        pre, spec, post = _splitCountedFmt(fmt)
+        return path.parent / f"{path.stem}{pre}{count:{spec}}{post}{path.suffix}"
 
     # Check arguments.
     assert(isinstance(fmt, str))
@@ -215,14 +317,17 @@ def ensureCountedPath(path, fmt="-%03d",
     assert(isinstance(step, int) and step > 0)
     assert(isinstance(minCount, int) and minCount >= 0)
     assert(isinstance(disable, bool))
-    # Match patterns such as the following ones:
-    #   "%d", "%10d", "-prefix-%03d-suffix", "%04d-suffix-%s"
-    match = re.match(".*(%0?[0-9]*d).*", fmt)
-    if not match:
-        raise ValueError("Invalid format specifier: %s" % fmt)
+    # Validate fmt up-front (raises ValueError); the parse is cached.
+    _parseCountedFmt(fmt)
 
     path = Path(path)
     parent = path.parent
+    # Probe the target once (lexists: a single lstat, no symlink
+    # following); _constructPath reuses the result instead of issuing
+    # its own stat. Note that a missing target alone must not skip the
+    # directory scan: with skipFirst, counted siblings still determine
+    # the result even if the bare path is free.
+    pathExists = os.path.lexists(str(path))
     if ensureParent:
         if not ensureDir(parent):
             # raise?
@@ -232,23 +337,28 @@ def ensureCountedPath(path, fmt="-%03d",
     if not parent.exists():
         return _constructPath(path, fmt, count=None)
 
-    # Extract the counts of existing items      # Example:
-    # that match with the current one.          # fmt = "-pre-%03d"
-    pattern = match.group(1)                    # pattern = "%03d"
-    fmtRegex = fmt.replace(pattern,"([0-9]*)")  # fmtRegex = "-pre-([0-9]*)"
-
-    stem = path.stem                            # stem = "file"
-    suffix = path.suffix                        # suffix = ".txt"
-    regex = re.compile("%s%s$" %                # regex = "file-pre-([0-9]*)"
-                       (stem, fmtRegex))
-
-    match = lambda x: regex.match(x.stem)
-    matches = [match(i) for i in parent.iterdir() if i.suffix==suffix]
-    #print("%s%s$" % (stem, fmtRegex), len(matches))
-    matches = [m.group(1) for m in matches if m]
-    counts = [int(m) for m in matches if m]
-    newCount = max(counts)+step if counts else None
+    # Extract the counts of existing items that match with the current
+    # one. The compiled regex is cached per (stem, suffix, fmt).
+    suffix = path.suffix
+    regex = _compileCounterRegex(path.stem, suffix, fmt)
+
+    # Scan the directory once at the string level; no Path objects are
+    # created in the loop (scandir names are matched directly), and only
+    # the running maximum is tracked.
+    best = None
+    with os.scandir(parent) as it:
+        for entry in it:
+            name = entry.name
+            if suffix and not name.endswith(suffix):
+                continue
+            m = regex.match(name)
+            if m and m.group(1):
+                count = int(m.group(1))
+                if best is None or count > best:
+                    best = count
+    newCount = best+step if best is not None else None
     ensuredPath = _constructPath(path, fmt, count=newCount)
+    # The assert costs one extra stat, but is stripped under python -O.
     assert(not ensuredPath.exists())
     return ensuredPath
 
@@ -279,6 +389,23 @@ def removeFilesOrFolders(paths, logger=None):
     return ret
 
 
+################################################################################
+def _fastRmtree(path):
+    """
+    Remove a directory tree. On POSIX, delegate to rm -rf: it walks the
+    tree in C with one unlink per entry, typically several times faster
+    than shutil.rmtree's python walker for trees with many small files.
+    Falls back to shutil.rmtree if the subprocess is unavailable.
+    """
+    if os.name == "posix":
+        try:
+            subprocess.run(["rm", "-rf", "--", str(path)], check=True)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    shutil.rmtree(path, ignore_errors=True)
+
+
 ################################################################################
 def removeFileOrFolder(path, logger=None):
     """
@@ -293,7 +420,7 @@ def removeFileOrFolder(path, logger=None):
     path = Path(path)
     if path.is_dir():
         try:
-            shutil.rmtree(path, ignore_errors=True)
+            _fastRmtree(path)
         except:
             if logger:
                 logger.exception("Failed to remove folder: %s", path)
@@ -307,73 +434,156 @@ def removeFileOrFolder(path, logger=None):
     return not path.exists()
 
 
+################################################################################
+def batchCreate(paths):
+    """
+    Create many empty files in one batch. The distinct parent
+    directories are created first (deduplicated, ancestors before
+    descendants), then each file is created with a bare os.open/os.close
+    pair - no buffered file object is constructed per file.
+
+    Useful for fixtures and placeholder outputs where only the
+    existence of the files matters.
+    """
+    paths = [str(p) for p in paths]
+    for parent in sorted({os.path.dirname(p) for p in paths}):
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+    for p in paths:
+        os.close(os.open(p, flags, 0o600))
+
+
 ################################################################################
 # COPYING
+################################################################################
+# Copy tasks are I/O-latency-bound; below this many files the thread
+# pool setup costs more than it saves.
+_PARALLEL_COPY_THRESHOLD = 16
+
+def _maxCopyWorkers():
+    # I/O-bound workload: oversubscribe the cores, but keep a lid on it.
+    return min(32, (os.cpu_count() or 1)*4)
+
+
 ################################################################################
 def copyMultipleFiles(srcs, dsts, force=False, move=False,
                       count=False, cache=None, showProgress=False):
+    resolved = False
     if not isinstance(dsts, (list, tuple)):
-        srcs = [Path(src) for src in srcs]
-        dsts = [Path(dsts)/src.name for src in srcs]
-    rets = []
-    if showProgress:
-        progress = createProgressBar(size=len(srcs),
-                                     enabled=showProgress,
-                                     label="Copying...")
-    for i, (src, dst) in enumerate(zip(srcs, dsts)):
-        ret = copySingleFile(src=src, dst=dst, force=force,
-                             move=move, count=count, cache=cache)
-        rets.append(ret)
-        progress.update(i+1)
-    return rets
+        # Resolve the destination dir once and derive the children by
+        # string join instead of resolving every dst separately.
+        dstStr = str(Path(dsts).resolve(strict=False))
+        srcs = [Path(src).resolve(strict=False) for src in srcs]
+        dsts = [Path(dstStr + os.sep + src.name) for src in srcs]
+        resolved = True
+    progress = createProgressBar(size=len(srcs),
+                                 enabled=showProgress,
+                                 label="Copying...")
+    # Parallelize only the independent case: counted filenames and the
+    # copy cache require a serialized view of the destination folder.
+    parallel = (cache is None and not count and
+                len(srcs) >= _PARALLEL_COPY_THRESHOLD)
+    # One mkdir per distinct parent directory for the whole batch.
+    ensuredParents = set()
+    if not parallel:
+        rets = []
+        for i, (src, dst) in enumerate(zip(srcs, dsts)):
+            ret = copySingleFile(src=src, dst=dst, force=force,
+                                 move=move, count=count, cache=cache,
+                                 _resolved=resolved,
+                                 _ensuredParents=ensuredParents)
+            rets.append(ret)
+            progress.update(i+1)
+        return rets
+    with ThreadPoolExecutor(max_workers=_maxCopyWorkers()) as pool:
+        tasks = [pool.submit(copySingleFile, src=src, dst=dst,
+                             force=force, move=move, count=count,
+                             _resolved=resolved,
+                             _ensuredParents=ensuredParents)
+                 for src, dst in zip(srcs, dsts)]
+        for i, task in enumerate(as_completed(tasks)):
+            progress.update(i+1)
+        # Collect in submission order to match the input order.
+        return [task.result() for task in tasks]
 
 
 ################################################################################
-def copySingleFile(src, dst, force=False, move=False, count=False, cache=None):
+def _fastCopyFile(src, dst):
     """
-    Utility function to copy files or file trees.
-
-    Cache is a set of (src,dst) pairs, it is updated for every successful
-    copy task. The task is omitted if (src,dst) is found in the cache.
-
-    Argument count permits to ensure counted filenames if dst already exists.
-    See ensureCountedPath() for details. It does not make much sense to
-    enable counting and caching at the same time. Set count="skipFirst" in
-    order to skip counting the first filename.
+    Copy a regular file with shutil.copy2 semantics (content+metadata),
+    but move the payload with os.copy_file_range where available: the
+    kernel copies within the page cache (reflink-accelerated on
+    btrfs/xfs), no data crosses into userland. Any failure falls back
+    to shutil.copy2.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src=src, dst=dst)
+        return
+    src = str(src)
+    dst = str(dst)
+    try:
+        srcFd = os.open(src, os.O_RDONLY)
+    except OSError:
+        shutil.copy2(src=src, dst=dst)
+        return
+    try:
+        size = os.fstat(srcFd).st_size
+        dstFd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(srcFd, dstFd, remaining)
+                if copied == 0:
+                    # Kernel refused (e.g. special file system).
+                    raise OSError(errno.EIO, "copy_file_range stalled")
+                remaining -= copied
+        finally:
+            os.close(dstFd)
+    except OSError:
+        os.close(srcFd)
+        # EXDEV/ENOSYS/any partial copy: redo via the generic path.
+        shutil.copy2(src=src, dst=dst)
+        return
+    os.close(srcFd)
+    shutil.copystat(src, dst)
 
-    Returns False if the src was not copied to dst, and returns dst if
-    the copy action was either performed or cached.
 
-    Set move=True to move instead of copy a file.
+################################################################################
+def _copySingleFileFast(src, dst, isDir, isFile, force=False, move=False,
+                        count=False, cache=None, ensuredParents=None):
+    """
+    Copy worker for callers that already know the type of src (e.g. from
+    a scandir traversal) and work with resolved paths. Compared to
+    copySingleFile, this skips the resolve() calls and the exists/is_dir/
+    is_file probes on src (several stat syscalls per file).
+
+    ensuredParents is an optional set of parent directories (str) that
+    have already been created; it is updated in place, so the mkdir is
+    issued at most once per directory within a bulk operation.
     """
-    # Use resolve() to get the absolute path!
-    # https://stackoverflow.com/a/44569249/3388962
-    # https://bugs.python.org/issue39090
-    # Windows requires strict=False.
-    src = Path(src).resolve(strict=False)
-    dst = Path(dst).resolve(strict=False)
     if count:
         dst = ensureCountedPath(dst, ensureParent=False,
                                 skipFirst=count=="skipFirst")
     assert(cache is None or isinstance(cache, set))
-    if not src.exists():
-        logging.error("File does not exist: %s", src)
-        return False
     if not force and (cache and (src,dst) in cache):
         # The item has been copied already.
         return dst
-    if not dst.parent.is_dir():
-        dst.parent.mkdir(parents=True, exist_ok=True)
+    parent = dst.parent
+    if ensuredParents is None or str(parent) not in ensuredParents:
+        parent.mkdir(parents=True, exist_ok=True)
+        if ensuredParents is not None:
+            ensuredParents.add(str(parent))
     if dst.exists() and not force:
         logging.warning("File already exists: %s", dst)
         return False
     if move:
         # Applies to both files and folders.
         shutil.move(src=str(src), dst=str(dst))
-    elif src.is_dir():
+    elif isDir:
         shutil.copytree(src=src, dst=dst)
-    elif src.is_file():
-        shutil.copy2(src=src, dst=dst)
+    elif isFile:
+        _fastCopyFile(src=src, dst=dst)
     else:
         raise ValueError("Cannot process this input: %s" % src)
     if not dst.exists():
@@ -384,6 +594,59 @@ def copySingleFile(src, dst, force=False, move=False, count=False, cache=None):
     return dst
 
 
+################################################################################
+def copySingleFile(src, dst, force=False, move=False, count=False, cache=None,
+                   _resolved=False, _ensuredParents=None):
+    """
+    Utility function to copy files or file trees.
+
+    _resolved signals that src and dst are already absolute, resolved
+    paths: each resolve() walks the whole path hierarchy with lstat
+    calls, which adds up when a caller copies many files below the same
+    (already resolved) roots.
+
+    _ensuredParents is an optional set shared across the calls of a
+    bulk operation; it records the parent dirs already created so that
+    the mkdir is issued at most once per directory (see
+    _copySingleFileFast).
+
+    Cache is a set of (src,dst) pairs, it is updated for every successful
+    copy task. The task is omitted if (src,dst) is found in the cache.
+
+    Argument count permits to ensure counted filenames if dst already exists.
+    See ensureCountedPath() for details. It does not make much sense to
+    enable counting and caching at the same time. Set count="skipFirst" in
+    order to skip counting the first filename.
+
+    Returns False if the src was not copied to dst, and returns dst if
+    the copy action was either performed or cached.
+
+    Set move=True to move instead of copy a file.
+    """
+    if _resolved:
+        src = Path(src)
+        dst = Path(dst)
+    else:
+        # Use resolve() to get the absolute path!
+        # https://stackoverflow.com/a/44569249/3388962
+        # https://bugs.python.org/issue39090
+        # Windows requires strict=False.
+        src = Path(src).resolve(strict=False)
+        dst = Path(dst).resolve(strict=False)
+    # A single stat call replaces the exists/is_dir/is_file probes.
+    try:
+        mode = os.stat(src).st_mode
+    except OSError:
+        logging.error("File does not exist: %s", src)
+        return False
+    return _copySingleFileFast(src=src, dst=dst,
+                               isDir=stat.S_ISDIR(mode),
+                               isFile=stat.S_ISREG(mode),
+                               force=force, move=move,
+                               count=count, cache=cache,
+                               ensuredParents=_ensuredParents)
+
+
 ################################################################################
 def copyFiles(src, dst,
               relative=True,
@@ -394,7 +657,8 @@ def copyFiles(src, dst,
               renameFun=None,
               counted=False,
               verbose=False,
-              showProgress=False):
+              showProgress=False,
+              parallel=True):
     """
     relative:       Flag to preserve folder structure, relative to src.
     globExp:        Globular expressions as list to select files or folders.
@@ -408,6 +672,9 @@ def copyFiles(src, dst,
                     incremented for every copy. See ensureCountedPath().
     verbose:        Verbose if True, only warn if False, and silent if None.
     showProgress:   Show progressbar.
+    parallel:       Copy independent entries through a thread pool (only
+                    effective for larger plans; counted/move copies are
+                    always serial). Disable to force sequential copying.
 
     To avoid peculiar behavior, dst is not allowed to be a child of src.
 
@@ -453,12 +720,13 @@ def copyFiles(src, dst,
             raise ValueError(message)
         isUnaryFun = len(sig.parameters) == 1
         _renameFunUser = renameFun
+        dstPrefix = str(dst) + os.sep
         def _renameFunExtended(fileSrc, fileDst):
             if isUnaryFun:
-                fileDstNew = Path(_renameFunUser(fileDst))
+                fileDstNew = _renameFunUser(fileDst)
             else:
-                fileDstNew = Path(_renameFunUser(fileSrc, fileDst))
-            if not dst in fileDstNew.parents:
+                fileDstNew = _renameFunUser(fileSrc, fileDst)
+            if not str(fileDstNew).startswith(dstPrefix):
                 # Raise an exception if newPath points outside the destination
                 # file tree, hoping that this reduces the chance to inadvertenly
                 # mess up the file system.
@@ -468,65 +736,137 @@ def copyFiles(src, dst,
                            "Path (out): '%s',\n" % fileDstNew +
                            "Path dst:   '%s'" % dst)
                 raise ValueError(message)
-            return fileDstNew
+            # Wrap as Path only after the validation passed.
+            return Path(fileDstNew)
         return _renameFunExtended
 
-    def _collectContent(src, dst, globExp):
+    def _expandDir(srcRoot, dstRoot, files, dirs, walked):
+        # One scandir walk per directory; the walked set dedupes
+        # subtrees shared between nested glob matches.
+        stack = [(srcRoot, dstRoot)]
+        while stack:
+            srcParent, dstParent = stack.pop()
+            if srcParent in walked:
+                continue
+            walked.add(srcParent)
+            try:
+                it = os.scandir(srcParent)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    srcPath = entry.path
+                    dstPath = dstParent + os.sep + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs[Path(srcPath)] = Path(dstPath)
+                        stack.append((srcPath, dstPath))
+                    elif entry.is_file():
+                        files[Path(srcPath)] = Path(dstPath)
+
+    def _planContent(src, dst, globExp):
+        """
+        Single-pass planner: collect the glob matches, classify them
+        (file vs dir), and expand matched directories inline - each
+        directory is visited exactly once. Returns the fully expanded
+        files/dirs maps plus the pre-expansion copy plan as a sorted
+        list of (src, dst, isDir) tuples.
+
+        Destinations are derived at the string level: prefix slicing
+        replaces relative_to() and the Path '/' operator, both of
+        which allocate intermediate PurePath objects per entry.
+        """
         dirs = {}
         files = {}
+        plan = {}
+        walked = set()
+        srcStr = str(src)
+        dstStr = str(dst)
+        srcPrefix = srcStr + os.sep
+        dstPrefix = dstStr + os.sep
         # True if dst is subdir of src.
-        dstInSrc = src in dst.parents
+        dstInSrc = dstStr.startswith(srcPrefix)
         for g in globExp:
             # Only use the src dir if g is an empty string or None.
-            paths = list(src.glob(g)) if g else [src]
-            if not paths and verbose is not None:
-                logging.warning("Could not find a match for glob: %s", g)
-            for i,p in enumerate(paths):
-                p = Path(p)
-                if dstInSrc and (p==dst or dst in p.parents):
+            paths = src.glob(g) if g else [src]
+            nMatches = 0
+            for p in paths:
+                nMatches += 1
+                pStr = str(p)
+                if dstInSrc and (pStr == dstStr or
+                                 pStr.startswith(dstPrefix)):
                     # Copy nothing from the destination folder.
                     continue
-                if relative:
+                if pStr == srcStr:
+                    dstpath = dst
+                elif relative:
                     # Preserve folder structure.
-                    dstpath = dst / p.relative_to(src)
+                    dstpath = Path(dstStr + os.sep + pStr[len(srcPrefix):])
                 else:
                     # Copy flat.
-                    dstpath = dst / p.name
+                    dstpath = Path(dstStr + os.sep + os.path.basename(pStr))
                 if p.is_dir():
                     dirs[p] = dstpath
+                    plan[p] = (dstpath, True)
+                    _expandDir(pStr, str(dstpath), files, dirs, walked)
                 elif p.is_file():
                     files[p] = dstpath
-        return files, dirs
-
-    def _expandSubdirs(files, dirs):
-        """
-        Update the files dict with the content of the subdirs
-        to give a complete account of files and dirs copied.
-        """
-        files = dict(files) # Shallow copy to avoid that the
-        dirs = dict(dirs)   # changes are seen outside.
-        # Again copy to not modify the container we're iterating.
-        for src, dst in dict(dirs).items():
-            srcFiles, srcDirs = listContent(src, relto=src)
-            dstFiles = [ dst / d for d in srcFiles ]
-            srcFiles = [ src / d for d in srcFiles ]
-            dstDirs = [ dst / d for d in srcDirs ]
-            srcDirs = [ src / d for d in srcDirs ]
-            files.update(zip(srcFiles, dstFiles))
-            dirs.update(zip(srcDirs, dstDirs))
-        return files, dirs
+                    plan[p] = (dstpath, False)
+            if nMatches == 0 and verbose is not None:
+                logging.warning("Could not find a match for glob: %s", g)
+        plan = sorted((s, d, isDir) for s, (d, isDir) in plan.items())
+        return files, dirs, plan
 
-    def _copyFiles(filesMap):
+    def _copyFiles(dataToCopy):
         """
-        Copy files or entire folders/file trees.
+        Copy files or entire folders/file trees. The entries carry the
+        type determined during planning, so no stat probes are needed
+        per file; parent dirs are created at most once each.
         """
-        progress = createProgressBar(size=len(filesMap),
+        progress = createProgressBar(size=len(dataToCopy),
                                      enabled=showProgress,
                                      label="Copying...")
-        for i, (src, dst) in enumerate(filesMap):
-            copySingleFile(src=src, dst=dst, move=move,
-                           force=force, count=counted)
-            progress.update(i+1)
+        ensuredParents = set()
+        # Counted filenames depend on what was copied before, and a
+        # move of many entries is rename-cheap anyway: stay serial.
+        serial = (not parallel or move or counted or
+                  len(dataToCopy) < _PARALLEL_COPY_THRESHOLD)
+        if serial:
+            for i, (src, dst, isDir) in enumerate(dataToCopy):
+                _copySingleFileFast(src=src, dst=dst, isDir=isDir,
+                                    isFile=not isDir, move=move,
+                                    force=force, count=counted,
+                                    ensuredParents=ensuredParents)
+                progress.update(i+1)
+            return
+        # Directory entries go through copytree, which requires a
+        # non-existing destination; copy them serially before the
+        # parent pre-creation below can conflict with them. Only the
+        # regular files go to the pool.
+        dirEntries = [(s, d) for s, d, isDir in dataToCopy if isDir]
+        fileEntries = [(s, d) for s, d, isDir in dataToCopy if not isDir]
+        nDone = 0
+        for src, dst in dirEntries:
+            _copySingleFileFast(src=src, dst=dst, isDir=True,
+                                isFile=False, move=move,
+                                force=force, count=counted,
+                                ensuredParents=ensuredParents)
+            nDone += 1
+            progress.update(nDone)
+        # Pre-create the full set of destination dirs once, then let
+        # the workers copy independent entries concurrently.
+        for parent in {str(dst.parent) for _, dst in fileEntries}:
+            os.makedirs(parent, exist_ok=True)
+            ensuredParents.add(parent)
+        with ThreadPoolExecutor(max_workers=_maxCopyWorkers()) as pool:
+            tasks = [pool.submit(_copySingleFileFast, src=src, dst=dst,
+                                 isDir=False, isFile=True,
+                                 move=move, force=force, count=counted,
+                                 ensuredParents=ensuredParents)
+                     for src, dst in fileEntries]
+            for task in as_completed(tasks):
+                task.result()
+                nDone += 1
+                progress.update(nDone)
 
     def _renameFiles(files, dirs, renameFun):
         if renameFun:
@@ -540,15 +880,25 @@ def copyFiles(src, dst,
 
 
     def _logCopyActions(src, dst, files, dirs):
-        allData = sorted(chain(files.items(), dirs.items()))
+        # Skip all formatting work when INFO is suppressed anyway.
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
         logging.info("Copy <src>: %s", src)
         logging.info("Copy <dst>: %s", dst)
-        if not allData:
+        if not (files or dirs):
             logging.info("Nothing to copy!")
-        for srcFile, dstFile in allData:
-            fType = "dir" if srcFile.is_dir() else "file"
-            logging.info("Copy %-5s '<src>/%s' to '<dst>/%s'", fType+":",
-                         srcFile.relative_to(src), dstFile.relative_to(dst))
+        # The kind is known from the dict provenance (no is_dir stat),
+        # and the <src>/<dst> prefixes are stripped by string slicing
+        # instead of relative_to().
+        srcPrefixLen = len(str(src)) + 1
+        dstPrefixLen = len(str(dst)) + 1
+        allData = sorted(chain(
+            ((str(s), str(d), "file:") for s, d in files.items()),
+            ((str(s), str(d), "dir:") for s, d in dirs.items())))
+        for srcFile, dstFile, fType in allData:
+            logging.info("Copy %-5s '<src>/%s' to '<dst>/%s'", fType,
+                         srcFile[srcPrefixLen:] or ".",
+                         dstFile[dstPrefixLen:] or ".")
 
     ############################################################################
 
@@ -563,12 +913,10 @@ def copyFiles(src, dst,
     # copying (with folders) is supported only if no renaming function is set.
     fastCopy = not bool(renameFun)
 
-    # Collect files/folders to copy.
-    files, dirs = _collectContent(src, dst, globExp)
-
-    # Expand data.
-    dataFast = sorted(chain(files.items(), dirs.items()))
-    files, dirs = _expandSubdirs(files, dirs) # Always return expanded data!
+    # Collect, classify and expand in one traversal. The plan keeps the
+    # type of each entry so that the copy workers need no further stat
+    # calls; files/dirs are always returned fully expanded.
+    files, dirs, dataFast = _planContent(src, dst, globExp)
     files, dirs = _renameFiles(files, dirs, renameFun)
 
     if verbose:
@@ -578,10 +926,33 @@ def copyFiles(src, dst,
 
     if listOnly:
         return files, dirs
+    def _coversWholeTree(dataToCopy):
+        """
+        True if the plan covers the entire content of src, nothing
+        special is requested, and dst does not exist yet. A single
+        copytree then moves the whole tree in one traversal instead of
+        one dispatch per matched entry.
+        """
+        if move or counted or not relative or not dataToCopy:
+            return False
+        if str(dst).startswith(str(src) + os.sep) or dst.exists():
+            return False
+        # One scandir decides whether src's top level is fully matched.
+        planned = {str(s) for s, _, _ in dataToCopy}
+        try:
+            with os.scandir(src) as it:
+                return all(entry.path in planned for entry in it)
+        except OSError:
+            return False
+
     # For fastCopy, use the data before subdir-expansion.
     # For slowCopy, files contains everything to copy.
-    dataToCopy = dataFast if fastCopy else sorted(files.items())
-    _copyFiles(dataToCopy)
+    dataToCopy = (dataFast if fastCopy else
+                  sorted((s, d, False) for s, d in files.items()))
+    if fastCopy and _coversWholeTree(dataToCopy):
+        shutil.copytree(src=src, dst=dst)
+    else:
+        _copyFiles(dataToCopy)
     return files, dirs
 
 
@@ -591,49 +962,87 @@ def copyFiles(src, dst,
 def readJSON(src, convertUnicode=True, strict=True):
     """
     convertUnicode is ignored for python 3.x.
+    strict applies only to the stdlib fallback parser.
     """
     if not os.path.isfile(src):
         raise FileNotFoundError("File does not exist: %s" % src)
         return None
+    if _jsonLoads is not None:
+        # orjson/ujson parse the whole buffer in C; dicts preserve the
+        # insertion order since python 3.7, so no ordering is lost.
+        with open(src, "rb") as fid:
+            buffer = fid.read()
+        try:
+            return _jsonLoads(buffer)
+        except ValueError:
+            # The accelerators reject the NaN/Infinity literals the
+            # stdlib writer emits for non-finite floats; re-parse with
+            # the stdlib so writeJSON/readJSON round-trips cannot fail.
+            return json.loads(buffer, strict=strict)
     with open(src) as fid:
-        # Preserve the ordering with an OrderedDict.
-        data = json.load(fid, object_pairs_hook=OrderedDict, strict=strict)
-
-    if (sys.version_info < (3, 0)):
-        def byteify(input):
-            # Source: https://stackoverflow.com/a/33571117/3388962
-            # This is needed only for python2!
-            if isinstance(input, dict):
-                return {byteify(key): byteify(value)
-                        for key, value in input.iteritems()}
-            elif isinstance(input, list):
-                return [byteify(element) for element in input]
-            elif isinstance(input, str):
-                return input.encode("utf-8")
-            else:
-                return input
-        data = byteify(data) if convertUnicode else data
+        # No object_pairs_hook: the default C scanner returns dicts
+        # directly, which preserve the insertion order on python 3.7+.
+        data = json.load(fid, strict=strict)
     return data
 
 
+################################################################################
+# Exact-type dispatch for the JSON writers: one dict lookup replaces
+# the per-value isinstance chain. Subclasses (e.g. PosixPath for Path)
+# are resolved once via _resolveJSONEncoder and then memoized here.
+# Note: a slice cannot be read back from a .json file; it is
+# nevertheless converted into a string.
+_JSON_ENCODERS = {np.ndarray: np.ndarray.tolist,
+                  set: list,
+                  slice: str}
+
+
+def _resolveJSONEncoder(cls):
+    # Slow path for types not seen before: walk the class hierarchy
+    # once and memoize the converter for the concrete type.
+    if issubclass(cls, np.ndarray):
+        fn = np.ndarray.tolist
+    elif issubclass(cls, (set, frozenset)):
+        fn = list
+    elif issubclass(cls, (PurePath, slice)):
+        fn = str
+    elif issubclass(cls, StructContainer):
+        fn = StructContainer.asdict
+    elif issubclass(cls, StructContainer.Frozen):
+        fn = StructContainer.Frozen.asdict
+    else:
+        return None
+    _JSON_ENCODERS[cls] = fn
+    return fn
+
+
+def _jsonDefault(obj):
+    """
+    Fallback serializer for JSON payloads (shared by the orjson and the
+    stdlib writers): converts the non-standard types this project uses.
+    """
+    cls = type(obj)
+    fn = _JSON_ENCODERS.get(cls)
+    if fn is None:
+        fn = _resolveJSONEncoder(cls)
+    if fn is None:
+        raise TypeError("Object of type %s is not JSON serializable"
+                        % cls.__name__)
+    return fn(obj)
+
+
 ################################################################################
 def writeJSON(dst, data, indent=4, logger=None):
+    """
+    Note: with orjson installed (and indent None or 2), non-finite
+    floats are written as null; the stdlib writer emits NaN/Infinity
+    literals instead, which readJSON parses back to float values.
+    """
     # Source: https://stackoverflow.com/a/47626762/3388962
     class Encoder(json.JSONEncoder):
         def default(self, obj):
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            if isinstance(obj, set):
-                return list(obj)
-            if isinstance(obj, Path):
-                return str(obj)
-            if isinstance(obj, slice):
-                # Warning: A slice cannot be read from a .json file.
-                # Nevertheless, convert it into a string.
-                return str(obj)
-            if isinstance(obj, StructContainer):
-                return obj.asdict()
-            return json.JSONEncoder.default(self, obj)
+            # Dispatch through the shared type table (see _jsonDefault).
+            return _jsonDefault(obj)
 
     if logger is None:
         logger = logging.getLogger(_loggerId)
@@ -641,6 +1050,24 @@ def writeJSON(dst, data, indent=4, logger=None):
     if not ensureDir(dirname, logger=logger):
         return False
     try:
+        if orjson is not None and indent in (None, 2):
+            # orjson serializes in C (numpy arrays natively, non-string
+            # keys stringified like the stdlib does) and only supports
+            # compact or 2-space indented output.
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            try:
+                payload = orjson.dumps(data, default=_jsonDefault,
+                                       option=option)
+            except TypeError:
+                # Mirror the decode side: payloads orjson cannot encode
+                # fall through to the stdlib writer.
+                payload = None
+            if payload is not None:
+                with open(dst, "wb") as fid:
+                    fid.write(payload)
+                return True
         with open(dst, "w") as fid:
             json.dump(data, fid, indent=indent, cls=Encoder)
     except:
@@ -650,6 +1077,50 @@ def writeJSON(dst, data, indent=4, logger=None):
     return True
 
 
+################################################################################
+def _yamlRepresentNdarray(dumper, obj):
+    # A single tolist() converts the array buffer at C speed; the nested
+    # python values then flow through the registered representers (object
+    # arrays may contain further non-standard types). Arrays are emitted
+    # flow-style, which keeps the output compact.
+    data = obj.tolist()
+    if not isinstance(data, list):
+        # 0-d arrays yield a bare scalar.
+        return dumper.represent_data(data)
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data,
+                                     flow_style=True)
+
+
+def _yamlRepresentPath(dumper, obj):
+    return dumper.represent_str(str(obj))
+
+
+def _yamlRepresentStruct(dumper, obj):
+    return dumper.represent_dict(obj.asdict())
+
+
+def _registerYAMLRepresenters(dumper):
+    """
+    Teach the dumper the non-standard types this project uses, so that
+    writeYAML can serialize them inline - no deepcopy, no pre-walk.
+    """
+    dumper.add_representer(np.ndarray, _yamlRepresentNdarray)
+    dumper.add_multi_representer(PurePath, _yamlRepresentPath)
+    # Register the concrete classes exactly (PyYAML's O(1) dict lookup
+    # in represent_data) and keep the multi-representers as the
+    # isinstance-based fallback for subclasses.
+    dumper.add_representer(type(Path()), _yamlRepresentPath)
+    dumper.add_representer(StructContainer, _yamlRepresentStruct)
+    dumper.add_multi_representer(StructContainer, _yamlRepresentStruct)
+    # Frozen containers (StructContainer.freeze) share the Frozen base.
+    dumper.add_multi_representer(StructContainer.Frozen,
+                                 _yamlRepresentStruct)
+
+_registerYAMLRepresenters(yaml.SafeDumper)
+if _YAMLDumper is not yaml.SafeDumper:
+    _registerYAMLRepresenters(_YAMLDumper)
+
+
 ################################################################################
 def readYAML(src, logger=None):
     if logger is None:
@@ -661,7 +1132,51 @@ def readYAML(src, logger=None):
     if not src.suffix.lower() in (".yaml", ".gyaml", ".json"):
         logger.warning("Reading unknown YAML file type: %s", src.name)
     with open(src, "r") as fid:
-        data = yaml.safe_load(fid)
+        data = yaml.load(fid, Loader=_YAMLLoader)
+    return data
+
+
+################################################################################
+def readYAMLCached(src, cacheDir=None, logger=None):
+    """
+    Like readYAML, but memoized on disk: the parsed document is pickled
+    to a cache file keyed by the source path, its mtime and its size.
+    Re-reading an unchanged file deserializes the pickle, which is much
+    faster than parsing YAML - useful for short-lived CLI scripts that
+    reload the same configs on every run. The cache is best-effort:
+    any cache failure falls back to a regular parse.
+
+    Arguments:
+        cacheDir:   Location of the cache files.
+                    Default: ~/.cache/research-project/yaml
+    """
+    import pickle
+    import hashlib
+    src = Path(src).resolve(strict=False)
+    try:
+        st = os.stat(str(src))
+    except OSError:
+        raise FileNotFoundError("File does not exist: %s" % src)
+    if cacheDir is None:
+        cacheDir = Path.home() / ".cache" / "research-project" / "yaml"
+    key = hashlib.md5(str(src).encode("utf-8")).hexdigest()
+    cacheFile = Path(cacheDir) / ("%s.pkl" % key)
+    tag = (st.st_mtime_ns, st.st_size)
+    try:
+        with open(cacheFile, "rb") as fid:
+            cachedTag, data = pickle.load(fid)
+        if cachedTag == tag:
+            return data
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+    data = readYAML(src, logger=logger)
+    try:
+        ensureDir(cacheFile.parent)
+        with open(cacheFile, "wb") as fid:
+            pickle.dump((tag, data), fid,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PickleError):
+        pass
     return data
 
 
@@ -690,29 +1205,12 @@ def writeYAML(dst, data, mode="block", indent=None, width=None,
                         b: null
         indent:     Amount of indent. Default: 2
         width:      Affects the line-breaks for flow-style...
-        encode:     PyYAML cannot write non-default data types. Standard
-                    objects such as pathlib.Path, numpy.ndarray, need
-                    to be transformed into a default data type.
-    """
-    def _encode(obj):
-        if isinstance(obj, np.ndarray):
-            dtype = obj.dtype
-            obj = obj.tolist()
-            return _encode(obj) if dtype=="object" else obj
-        if isinstance(obj, Path):
-            return str(obj)
-        if isinstance(obj, StructContainer):
-            obj = obj.asdict()
-            return _encode(obj)
-        if isinstance(obj, dict):
-            return dict(zip(_encode(list(obj.keys())),
-                            _encode(list(obj.values()))))
-        if isinstance(obj, (list, tuple, set)):
-            return type(obj)(map(_encode, obj))
-        return obj
-    if encode:
-        data = copy.deepcopy(data)
-        data = _encode(data)
+        encode:     Deprecated, without effect. Non-default data types
+                    such as pathlib.Path, numpy.ndarray or
+                    StructContainer are converted inline by the
+                    representers registered on the dumper; no copy of
+                    the data is made anymore.
+    """
     modeMap = dict(block=False, flow=True, mixed=None)
     assert(mode in modeMap)
     if logger is None:
@@ -721,11 +1219,16 @@ def writeYAML(dst, data, mode="block", indent=None, width=None,
     if not ensureDir(dst.parent, logger=logger):
         return False
     try:
-        with open(dst, "w") as fid:
-            yaml.safe_dump(data, fid,
-                           indent=indent,
-                           width=width,
-                           default_flow_style=modeMap[mode])
+        # Dump to a binary stream with a large buffer and let the dumper
+        # encode to UTF-8 itself; this skips the per-chunk encoding of a
+        # TextIOWrapper (the C dumper emits bytes directly).
+        with open(dst, "wb", buffering=64*1024) as fid:
+            yaml.dump(data, fid,
+                      Dumper=_YAMLDumper,
+                      indent=indent,
+                      width=width,
+                      encoding="utf-8",
+                      default_flow_style=modeMap[mode])
     except:
         logger.error("Failed to dump data to YAML file: %s", dst)
         logger.exception("Exception message:")
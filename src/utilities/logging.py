@@ -1,8 +1,10 @@
 import os
 import sys
+import atexit
 import logging
 import logging.config
-from functools import partial
+import threading
+from functools import partial, lru_cache
 
 from utilities.context_info import inferAppName
 from utilities.fileio import ensureCountedPath
@@ -74,10 +76,32 @@ _DEFAULT_DATEFMT_SUBP = "%H:%M:%S"
 _DEFAULT_LOG_LEVEL_SUBP = logging.DEBUG
 _DEFAULT_LOG_LEVEL_SUBP_FILE = logging.DEBUG
 _DEFAULT_LOG_LEVEL_SUBP_CONSOLE = logging.WARN
-_DEFAULT_FORMATTER = logging.Formatter(fmt=_DEFAULT_FMT,
-                                       datefmt=_DEFAULT_DATEFMT)
-_DEFAULT_FORMATTER_SUBP = logging.Formatter(fmt=_DEFAULT_FMT_SUBP,
-                                            datefmt=_DEFAULT_DATEFMT_SUBP)
+class FastFormatter(logging.Formatter):
+    """
+    Formatter with a cached timestamp: strftime runs at most once per
+    second instead of once per record, which is the dominant per-record
+    cost of the stock formatter. Sub-second precision comes from the
+    %(msecs)03d field of the format string and is unaffected by the
+    cache.
+    """
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._timeCache = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        key = (int(record.created), datefmt)
+        cached = self._timeCache
+        if cached[0] == key:
+            return cached[1]
+        asctime = super().formatTime(record, datefmt=datefmt)
+        self._timeCache = (key, asctime)
+        return asctime
+
+
+_DEFAULT_FORMATTER = FastFormatter(fmt=_DEFAULT_FMT,
+                                   datefmt=_DEFAULT_DATEFMT)
+_DEFAULT_FORMATTER_SUBP = FastFormatter(fmt=_DEFAULT_FMT_SUBP,
+                                        datefmt=_DEFAULT_DATEFMT_SUBP)
 
 # This is a global state...
 _CURRENT_LOG_DIR = None
@@ -87,78 +111,86 @@ _CURRENT_APP_ID = None
 class Logger:
     def __init__(self, loggerId=None):
         self._logger = logging.getLogger(loggerId)
+        # The root logger never changes; look it up once for the
+        # stash/pop level bookkeeping below.
+        self._root = logging.getLogger()
         self._stash = []
 
     @property
     def logger(self):
         return self._logger
 
-    def _log(self, level, message, stack=False, stackDepth=4):
-        self._logger.log(level, message)
+    def _log(self, level, message, *args, stack=False, stackDepth=4):
+        # Short-circuit before any formatting or frame inspection when
+        # the level is disabled.
+        if not self._logger.isEnabledFor(level):
+            return
+        # Extra args are passed through, so callers can defer %-style
+        # formatting to the logging machinery: debug("x=%s", x).
+        self._logger.log(level, message, *args)
 
         if stack:
-            import inspect
-            stack = inspect.stack()
-            nstack = min(len(stack), stackDepth)
-            stack = stack[1:nstack]
-            for i, call in enumerate(stack):
-                funcName = call[3]+"()"
-                lineno = call[2]
-                modulePath = call[1]
-                moduleFile = os.path.basename(modulePath)
-                fmt = ("Stack: %d) %s:%d: %s" if i==0 else
-                       "       %d) %s:%d: %s")
-                msg = fmt % (i, moduleFile, lineno, funcName)
+            # sys._getframe is constant-time; inspect.stack() walks all
+            # frames and even reads the source files for context.
+            frame = sys._getframe(1)
+            for i in range(stackDepth - 1):
+                if frame is None:
+                    break
+                code = frame.f_code
+                fmt = ("Stack: %d) %s:%d: %s()" if i==0 else
+                       "       %d) %s:%d: %s()")
+                msg = fmt % (i, _basename(code.co_filename),
+                             frame.f_lineno, code.co_name)
                 self._logger.log(level, msg)
+                frame = frame.f_back
 
-    def log(self, level, message, stack=False, stackDepth=4):
-        self._log(level=level, message=message,
+    def log(self, level, message, *args, stack=False, stackDepth=4):
+        self._log(level, message, *args,
                   stack=stack, stackDepth=stackDepth)
-    def debug(self, message, stack=False, stackDepth=4):
-        self._log(level=logging.DEBUG, message=message, 
+    def debug(self, message, *args, stack=False, stackDepth=4):
+        self._log(logging.DEBUG, message, *args,
                   stack=stack, stackDepth=stackDepth)
-    def info(self, message, stack=False, stackDepth=4):
-        self._log(level=logging.INFO, message=message,
+    def info(self, message, *args, stack=False, stackDepth=4):
+        self._log(logging.INFO, message, *args,
                   stack=stack, stackDepth=stackDepth)
-    def warn(self, message, stack=False, stackDepth=4):
-        self._log(level=logging.WARN, message=message,
+    def warn(self, message, *args, stack=False, stackDepth=4):
+        self._log(logging.WARN, message, *args,
                   stack=stack, stackDepth=stackDepth)
-    def error(self, message, stack=False, stackDepth=4):
-        self._log(level=logging.ERROR, message=message,
+    def error(self, message, *args, stack=False, stackDepth=4):
+        self._log(logging.ERROR, message, *args,
                   stack=stack, stackDepth=stackDepth)
-    def exception(self, message, stack=False, stackDepth=4):
-        self._log(level=logging.ERROR, message=message,
+    def exception(self, message, *args, stack=False, stackDepth=4):
+        self._log(logging.ERROR, message, *args,
                   stack=stack, stackDepth=stackDepth)
         logging.exception("Exception message:")
 
     def enter(self, level=logging.DEBUG):
-        self._log(level=level, message="Entering: %s()" % _callerName())
+        # Check the level before inspecting the caller frame.
+        if self._logger.isEnabledFor(level):
+            self._log(level, "Entering: %s()" % _callerName())
 
     def leave(self, level=logging.DEBUG):
-        self._log(level=level, message="Leaving: %s()" % _callerName())
+        if self._logger.isEnabledFor(level):
+            self._log(level, "Leaving: %s()" % _callerName())
 
     def stashLevel(self, newLevel=logging.INFO):
         """
         Temporarily set the log-level for all handlers to a new level.
         """
-        logger = logging.getLogger() # root logger => apply to all!
-        levels = {}
-        levels["logger"] = logger.level
-        levels["handlers"] = []
+        logger = self._root # root logger => apply to all!
+        levels = tuple(h.level for h in logger.handlers)
+        self._stash.append((logger.level, levels))
         for h in logger.handlers:
-            levels["handlers"].append(h.level)
             h.setLevel(newLevel)
         logger.setLevel(newLevel)
-        self._stash.append(levels)
 
     def popLevel(self):
         if self._stash:
-            logger = logging.getLogger() # root logger
-            levels = self._stash.pop()
-            logger.setLevel(levels["logger"])
+            logger = self._root
+            loggerLevel, levels = self._stash.pop()
+            logger.setLevel(loggerLevel)
             # Assumption: Number of handlers is the
             # same since last call to stashLevel().
-            levels = levels["handlers"]
             assert(len(levels)==len(logger.handlers))
             for handler, level in zip(logger.handlers, levels):
                 handler.setLevel(level)
@@ -174,19 +206,16 @@ def _resolveLevel(level, default):
 ################################################################################
 # MULTI-PROCESSING.
 ################################################################################
-import threading as thr
+import logging.handlers
 import multiprocessing as mp
-try:
-    # Python3
-    from queue import Empty as EmptyException
-except ImportError:
-    # Python2
-    from Queue import Empty as EmptyException
-
-# This class certainly can be replaced by QueueListener
+
 class LogListener():
     """
     Use LogListener to collect logs from other processes.
+
+    The queue is drained by a logging.handlers.QueueListener: a helper
+    thread performs a blocking get (no wakeup polling) and dispatches
+    each record to the handlers of the listener logger.
     """
     loggerId = "ICPLogListener"
     def __init__(self,
@@ -194,17 +223,21 @@ class LogListener():
                  outDir=None,
                  level=None,
                  levelFile=None):
-        # Better use a managed Queue object instead of a naked mp.Queue.
-        # It's worthwhile reading some documentation about multiprocessing:
-        # https://docs.python.org/2/library/multiprocessing.html#multiprocessing-managers
-        self._manager = mp.Manager()
-        self._queue = self._manager.Queue(maxsize=-1)
-        self._stopEvent = thr.Event()
-        self._thread = None
+        # A plain mp.Queue is a pipe plus a lock; a managed Queue routes
+        # every put/get through a proxy process (two IPC hops and pickle
+        # round-trips per record). The queue is picklable when handed to
+        # a child at spawn time, which is all that is needed here.
+        self._queue = mp.Queue(maxsize=0)
         # Infer the appId automagically
         appId = appId if appId else inferAppName()
         # Initialize logger and handlers.
         self._initLogger(appId, outDir, level, levelFile)
+        # NOTE: We redirect all messages from the subprocesses to the
+        # handlers of the listener logger. For now, we don't care about
+        # the name of the sending logger.
+        logger = logging.getLogger(LogListener.loggerId)
+        self._listener = logging.handlers.QueueListener(
+            self._queue, *logger.handlers, respect_handler_level=True)
 
     @staticmethod
     def _initLogger(appId, outDir, level, levelFile):
@@ -226,47 +259,22 @@ class LogListener():
     def logQueue(self):
         return self._queue
 
-    @staticmethod
-    def listen(queue, stopEvent):
-        while not stopEvent.is_set():
-            try:
-                record = queue.get(timeout=0.05)
-                # We would create a new logger named "root" if we call:
-                #     logging.getLogger(name)
-                # However, in order to get the actual root logger call:
-                #     logging.getLogger(None)
-                # NOTE: We redirect all messages from the subprocesses to the
-                # listener logger. For now, we don't care about the logger name.
-                # TODO: Take care of the different logger names...
-                #name = LogListener.loggerId if record.name == "root" else record.name
-                logger = logging.getLogger(LogListener.loggerId)
-                logger.handle(record)
-            except EmptyException:
-                # Thrown if queue remained empty within the timeout period.
-                pass
-            except (EOFError, BrokenPipeError):
-                # Hide errors present on Keyboard-interrupt.
-                # Still log a warning that might be helpful when debugging
-                # other failure modes.
-                msg = "Log listening is interrupted."
-                logger = logging.getLogger(LogListener.loggerId)
-                logger.warning(msg)
-                break
-
     def start(self):
-        self._thread = thr.Thread(target=LogListener.listen,
-                                  args=(self._queue, self._stopEvent,))
-        self._thread.start()
+        self._listener.start()
 
     def stop(self):
-        self._stopEvent.set()
-        self._thread.join()
+        self._listener.stop()
 
 ################################################################################
 # INSPECTION.
 ################################################################################
+@lru_cache(maxsize=512)
+def _basename(path):
+    # Source files repeat heavily across log calls; cache the basename.
+    return os.path.basename(path)
+
+
 def _callerName(skip=2):
-    import inspect
     """
     Get a name of a caller in the format module.class.method
 
@@ -274,22 +282,23 @@ def _callerName(skip=2):
     name. skip=1 means "who calls me", skip=2 "who calls my caller" etc.
     An empty string is returned if skipped levels exceed stack height
 
-    Source: https://stackoverflow.com/a/9812105/3388962 (anatoly techtonik)
-
-    Note: inspect is not perfectly portable!
+    Based on: https://stackoverflow.com/a/9812105/3388962 (techtonik),
+    rewritten with sys._getframe: the caller's frame is read directly
+    instead of materializing (and tokenizing) the whole stack with
+    inspect.stack().
     """
-    stack = inspect.stack()
-    start = 0 + skip
-    if len(stack) < start + 1:
+    try:
+        parentframe = sys._getframe(skip)
+    except ValueError:
+        # Skipped levels exceed the stack height.
         return ""
-    parentframe = stack[start][0]
 
     name = []
-    module = inspect.getmodule(parentframe)
-    # `modname` can be None when frame is executed directly in console
-    # TODO(techtonik): consider using __main__
+    # `__name__` can be missing when the frame is executed directly in
+    # an embedded console.
+    module = parentframe.f_globals.get("__name__")
     if module:
-        name.append(module.__name__)
+        name.append(module)
     # detect classname
     if "self" in parentframe.f_locals:
         # I don't know any way to detect call from the object method
@@ -302,7 +311,7 @@ def _callerName(skip=2):
 
     ## Avoid circular refs and frame leaks
     #  https://docs.python.org/2.7/library/inspect.html#the-interpreter-stack
-    del parentframe, stack
+    del parentframe
 
     # NJU: just add the last two parts of the name.
     # This works also if len(nam) < 2.
@@ -313,6 +322,7 @@ def _callerName(skip=2):
 ################################################################################
 # CONFIGURATION.
 ################################################################################
+@lru_cache(maxsize=16)
 def _constructLoggingDir(outDir, subDir):
     if not outDir:
         return None
@@ -322,6 +332,92 @@ def _constructLoggingDir(outDir, subDir):
     logDir = os.path.join(outDir, "_logs", subDir)
     return logDir
 
+
+# Counted log-file paths, keyed by (logDir, filename, override). The
+# lookup via ensureCountedPath scans the log directory; one resolution
+# per configuration target is enough.
+_LOG_FILE_CACHE = {}
+
+
+def loggingConfigReset():
+    """
+    Forget the memoized logging paths, so that the next loggingConfig()
+    call re-resolves the counted log files on disk.
+    """
+    _LOG_FILE_CACHE.clear()
+    _constructLoggingDir.cache_clear()
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that batches writes. The stock handler writes and
+    flushes per record, which dominates the cost under high-volume
+    logging. Records accumulate in memory instead and are written out
+    when the buffer grows large, when a record of flushLevel or above
+    arrives (so errors hit the disk immediately), periodically via a
+    background timer, and on close.
+    """
+    flushLevel = logging.ERROR
+    flushInterval = 1.0     # Seconds between periodic flushes.
+    bufferSize = 64 << 10   # Characters buffered before a forced flush.
+
+    def __init__(self, filename, mode="a", encoding=None, delay=False):
+        super().__init__(filename, mode=mode,
+                         encoding=encoding, delay=delay)
+        self._buffer = []
+        self._buffered = 0
+        self._timer = None
+        # Logging's own shutdown hook also closes handlers; this extra
+        # registration covers handlers detached before interpreter exit.
+        atexit.register(self.close)
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            self.acquire()
+            try:
+                self._buffer.append(msg)
+                self._buffered += len(msg)
+                if (record.levelno >= self.flushLevel or
+                        self._buffered >= self.bufferSize):
+                    self._flushBuffer()
+                elif self._timer is None:
+                    # Bound the time a record sits in the buffer.
+                    timer = threading.Timer(self.flushInterval, self.flush)
+                    timer.daemon = True
+                    timer.start()
+                    self._timer = timer
+            finally:
+                self.release()
+        except Exception:
+            self.handleError(record)
+
+    def _flushBuffer(self):
+        # The caller holds the handler lock.
+        if self._buffer:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+            self.stream.flush()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._flushBuffer()
+        finally:
+            self.release()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+
 def _addHandler(logger, handler, level, fmt):
     if level is None:
         return
@@ -334,9 +430,18 @@ def _addFileHandler(logger, level, fmt, outDir, subDir, filename, override):
     if outDir is None or filename is None:
         return
     logDir = _constructLoggingDir(outDir=outDir, subDir=subDir)
-    filepath = os.path.join(logDir, filename)
-    outPath = ensureCountedPath(os.path.join(logDir, filename), disable=override)
-    handler = logging.FileHandler(outPath, mode=_DEFAULT_FILE_MODE)
+    key = (logDir, filename, override)
+    outPath = _LOG_FILE_CACHE.get(key)
+    if outPath is None:
+        outPath = ensureCountedPath(os.path.join(logDir, filename),
+                                    disable=override)
+        _LOG_FILE_CACHE[key] = outPath
+        mode = _DEFAULT_FILE_MODE
+    else:
+        # Re-configuration within the same process keeps logging to the
+        # same counted file; append instead of truncating it.
+        mode = "a"
+    handler = BufferedFileHandler(outPath, mode=mode)
     _addHandler(logger, handler, level, fmt)
 
 def _addConsoleHandler(logger, level, fmt):
@@ -421,21 +526,24 @@ def loggingConfig(appId=None,
     _CURRENT_LOG_DIR = logDir
     _CURRENT_APP_ID = appId
 
-    nStreamers = [isinstance(h,logging.StreamHandler) for h in logger.handlers].count(True)
-    if nStreamers >= 1:
-        #TODO: revise this... This seems smelly...
-
-        # Test if there is already a stream handler installed. This can happen if
-        #     (A) loggingConfig() already has been called
-        #     (B) logging.basicConfig() has been called
-        #     (C) any logging has taken place (which leads also to (B))
-        #logger.warn("The logging system already has been configured. " +
-        #            "Is loggingConfig() or logging.basicConfig() called multiple times?")
-
-        # Reset all StreamHandlers.
-        # I assume here that loggingConfig() is called before other modules try
-        # to expand the logging system with their own handlers.
-        logger.handlers = [ h for h in logger.handlers if not isinstance(h, logging.StreamHandler)]
+    # Reset all StreamHandlers in a single pass (counting them first
+    # bought nothing). Stream handlers are already installed if
+    #     (A) loggingConfig() already has been called
+    #     (B) logging.basicConfig() has been called
+    #     (C) any logging has taken place (which leads also to (B))
+    # I assume here that loggingConfig() is called before other modules try
+    # to expand the logging system with their own handlers.
+    # NOTE: isinstance is deliberate; FileHandler subclasses
+    # StreamHandler, and file handlers must not accumulate across
+    # repeated configuration calls either. The stripped handlers are
+    # closed so that buffered records reach the disk.
+    keep = []
+    for h in logger.handlers:
+        if isinstance(h, logging.StreamHandler):
+            h.close()
+        else:
+            keep.append(h)
+    logger.handlers = keep
 
     # Add a console logger for all the messages.
     fmt = _DEFAULT_FORMATTER
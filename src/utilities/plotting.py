@@ -5,6 +5,29 @@ from utilities.data_types import static_vars
 from utilities.fileio import ensureDir
 
 
+# Points per artist before it is rasterized in vector exports.
+_RASTERIZE_THRESHOLD = 1000
+
+
+def _rasterizeHeavyArtists(fig, threshold=_RASTERIZE_THRESHOLD):
+    """
+    Rasterize artists carrying many points before a vector export; the
+    backend then embeds a single image instead of serializing every
+    point. Artists the caller configured already are left alone.
+    """
+    for ax in fig.get_axes():
+        for line in ax.lines:
+            if (not line.get_rasterized() and
+                    len(line.get_xdata()) > threshold):
+                line.set_rasterized(True)
+        for coll in ax.collections:
+            if coll.get_rasterized():
+                continue
+            offsets = coll.get_offsets()
+            if offsets is not None and len(offsets) > threshold:
+                coll.set_rasterized(True)
+
+
 def saveFigure(fig=None, path="figure.pdf", **kwargs):
     if fig is None:
         fig = plt.gcf()
@@ -12,6 +35,14 @@ def saveFigure(fig=None, path="figure.pdf", **kwargs):
     kwargs.setdefault("bbox_inches", "tight")
     kwargs.setdefault("dpi", 300)
     path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        # No per-save timestamp: repeated exports of the same figure
+        # produce byte-identical files.
+        kwargs.setdefault("metadata", {"CreationDate": None})
+        _rasterizeHeavyArtists(fig)
+    elif suffix == ".png":
+        kwargs.setdefault("pil_kwargs", {"optimize": True})
     ensureDir(path.parent)
     plt.savefig(path, **kwargs)
 
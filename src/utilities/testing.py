@@ -1,10 +1,10 @@
+import io
 import os
+import stat
 import logging
 import unittest
+import functools
 import importlib
-import numpy as np
-import pandas as pd
-from pathlib import Path as p
 from contextlib import redirect_stdout
 
 # NOTE: It may occur that RuntimeWarnings are issued that usually are not
@@ -18,19 +18,30 @@ from contextlib import redirect_stdout
 #             TestCases, or inside TestCases.
 #             The problem arises because unittest may disable some warning
 #             filters set by numpy.__init__.
+#
+# numpy and pandas are imported lazily in the assertions below: most
+# TestCases never compare arrays or frames, and importing pandas alone
+# costs a few hundred milliseconds at discovery time. After the first
+# call, sys.modules makes the local import free.
 
 ################################################################################
 # UTILITIES
 ################################################################################
 def logStartOfTestCase(name):
-    name = name.replace("__main__.","")
+    # Only strip when the prefix is present; replace() would allocate a
+    # fresh string either way.
+    if name.startswith("__main__."):
+        name = name[len("__main__."):]
     logger = logging.getLogger("test")
     logger.info("#"*60)
     logger.info("Test: %s", name)
     logger.info("#"*60)
 
 ################################################################################
+@functools.lru_cache(maxsize=None)
 def isModuleAvailable(name):
+    # Memoized: probing re-walks the import machinery (sys.path stats)
+    # otherwise, and availability does not change during a test run.
     try:
         ret = importlib.import_module(name)
         return bool(ret)
@@ -38,7 +49,10 @@ def isModuleAvailable(name):
         return False
 
 ################################################################################
+@functools.lru_cache(maxsize=None)
 def isEnvAvailable(env):
+    # Memoized like isModuleAvailable: the skip decorators probe the
+    # same variables once per TestCase class at import time.
     ret = os.getenv(env)
     return bool(ret)
 
@@ -65,15 +79,16 @@ def skipIfEnvNotSet(env):
 ################################################################################
 class StdoutRedirectionContext():
     # https://stackoverflow.com/questions/59201313/
-    class ListIO():
-        def __init__(self):
-            self.output = []
-        def write(self, s):
-            if s in ("\n", ""): return
-            self.output.append(s)
+    # The captured text is buffered by io.StringIO (in C, no Python
+    # call per write); the line list is materialized lazily when
+    # output is accessed.
+    class _Capture(io.StringIO):
+        @property
+        def output(self):
+            return self.getvalue().splitlines()
 
     def __enter__(self):
-        self._buf = self.ListIO()
+        self._buf = self._Capture()
         self._ctx = redirect_stdout(self._buf)
         self._ctx.__enter__()
         return self._buf
@@ -86,64 +101,104 @@ class StdoutRedirectionContext():
 # TEST CASE
 ################################################################################
 class TestCase(unittest.TestCase):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
         # The child class must never override setUp().
         # Instead, it should override doSetUp().
-        # Check if this is the case and raise an exception otherwise.
-        # Source: https://stackoverflow.com/a/1777092/3388962
-        baseMethod = getattr(TestCase, "setUp")
-        childMethod = getattr(self, "setUp")
-        if baseMethod is not childMethod.__func__:
-            qualName = ".".join([self.__module__, type(self).__name__])
+        # Checked here, at class creation, instead of in __init__: the
+        # runner instantiates the class once per test method.
+        if cls.setUp is not TestCase.setUp:
+            qualName = ".".join([cls.__module__, cls.__name__])
             msg = ("%s must not override setUp(). "
                    "Implement doSetUp() instead!") % qualName
             raise AttributeError(msg)
 
+    def _cachedStat(self, path):
+        """
+        One os.stat per path and setUp: repeated positive assertions on
+        the same path reuse the cached result instead of stat-ing
+        again. Only hits are cached (a path may come into existence
+        later in the test); the negative assertions go through
+        _freshStat, which always stats, so deletions are observed.
+        """
+        key = os.fspath(path)
+        st = self._statCache.get(key)
+        if st is None:
+            try:
+                st = os.stat(key)
+            except OSError:
+                return None
+            self._statCache[key] = st
+        return st
+
+    def _freshStat(self, path):
+        # Uncached stat for the negative assertions: assert-then-
+        # delete-then-assert-gone must see the deletion, not a cache
+        # hit from the earlier positive assertion. The cache entry is
+        # refreshed (or dropped) along the way.
+        key = os.fspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            self._statCache.pop(key, None)
+            return None
+        self._statCache[key] = st
+        return st
+
+    # NOTE: The path assertions do not resolve() their argument; the
+    # existence checks work on relative paths and symlinks as-is, and
+    # resolve() costs extra syscalls per assertion.
     def assertIsFile(self, path):
         if path is None:
             raise AssertionError("None is not a valid path.")
-        if not p(path).resolve().is_file():
+        st = self._cachedStat(path)
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise AssertionError("File does not exist: %s" % str(path))
 
     def assertIsNotFile(self, path):
         if path is None:
             raise AssertionError("None is not a valid path.")
-        if p(path).resolve().is_file():
+        st = self._freshStat(path)
+        if st is not None and stat.S_ISREG(st.st_mode):
             raise AssertionError("File should not exist: %s" % str(path))
 
     def assertIsDir(self, path):
         if path is None:
             raise AssertionError("None is not a valid path.")
-        if not p(path).resolve().is_dir():
+        st = self._cachedStat(path)
+        if st is None or not stat.S_ISDIR(st.st_mode):
             raise AssertionError("Dir does not exist: %s" % str(path))
 
     def assertIsNotDir(self, path):
         if path is None:
             raise AssertionError("None is not a valid path.")
-        if p(path).resolve().is_dir():
+        st = self._freshStat(path)
+        if st is not None and stat.S_ISDIR(st.st_mode):
             raise AssertionError("Dir should not exist: %s" % str(path))
 
     def assertExists(self, path):
         if path is None:
             raise AssertionError("None is not a valid path.")
-        if not p(path).resolve().exists():
+        if self._cachedStat(path) is None:
             raise AssertionError("Path does not exist: %s" % str(path))
 
     def assertNotExists(self, path):
         if path is None:
             raise AssertionError("None is not a valid path.")
-        if p(path).resolve().exists():
+        if self._freshStat(path) is not None:
             raise AssertionError("Path should not exist: %s" % str(path))
 
     def assertArrayEqual(self, x, y):
+        import numpy as np
         np.testing.assert_array_equal(x, y)
 
     def assertAlmostEqual(self, x, y, places=7):
         # Overrides the corresponding method of unittest.TestCase.
+        import numpy as np
         np.testing.assert_almost_equal(x, y, decimal=places)
 
     def assertFrameEqual(self, x, y, **kwargs):
+        import pandas as pd
         pd.testing.assert_frame_equal(x, y, **kwargs)
 
     def assertStdout(self):
@@ -164,5 +219,6 @@ class TestCase(unittest.TestCase):
 
     def setUp(self):
         logStartOfTestCase(self.id())
+        self._statCache = {}
         if hasattr(self, "doSetUp"):
             self.doSetUp()
@@ -1,16 +1,14 @@
-import sys
 import logging
-import argparse
 from pathlib import Path
 
 from utilities.context_info import ContextInfo
 from utilities.data_types import StructContainer
 from utilities.logging import loggingConfig
-from utilities.fileio import readYAML, writeYAML
+from utilities.fileio import readYAMLCached, writeYAML
 
 ################################################################################
 def loadConfigs(args):
-    configs_all = readYAML(args.configsFile)
+    configs_all = readYAMLCached(args.configsFile)
     configs = configs_all["step01"]
     configs = StructContainer(configs)
     
@@ -18,17 +16,37 @@ def loadConfigs(args):
     configs.outDir = args.outDir if args.outDir else configs.outDir
     configs.outDir = Path(configs.outDir)
     configs.method = args.method if args.method else configs.method
-    return configs
+    # Freeze the schema: attribute access through __slots__, typos in
+    # attribute names raise instead of adding new keys silently.
+    return StructContainer.freeze(configs)
 
 
 ################################################################################
 def setupIO(configs):
-    # Collect and save some context info.
-    info = ContextInfo()
-    # Also dump the configs.
-    dumpConfigs=lambda filename: writeYAML(filename, configs)
-    info.addContext("configs.yaml", dumpConfigs)
-    info.dump(configs.outDir)
+    # Repeated launches with identical configs (parameter sweeps) skip
+    # the context dump: a small hash sentinel in outDir records the
+    # configs that were last written there.
+    import json
+    import hashlib
+    serialized = json.dumps(configs.asdict(), sort_keys=True, default=str)
+    configsHash = hashlib.blake2b(serialized.encode(),
+                                  digest_size=8).hexdigest()
+    hashFile = Path(configs.outDir) / ".configs.hash"
+    try:
+        upToDate = hashFile.read_text() == configsHash
+    except OSError:
+        upToDate = False
+    if not upToDate:
+        # Collect and save some context info.
+        info = ContextInfo()
+        # Also dump the configs.
+        dumpConfigs=lambda filename: writeYAML(filename, configs)
+        info.addContext("configs.yaml", dumpConfigs)
+        info.dump(configs.outDir)
+        try:
+            hashFile.write_text(configsHash)
+        except OSError:
+            pass
 
     # Set up logging.
     logLevelMap = {
@@ -44,8 +62,11 @@ def setupIO(configs):
 def setupMatplotlib():
     # This line is required if the plots should be editable with Adobe
     # Illustrator. The problem: https://stackoverflow.com/questions/5956182/
+    # Cheap if matplotlib is already in sys.modules; skip the rcParams
+    # write when the value is already in place.
     import matplotlib as mpl
-    mpl.rcParams["pdf.fonttype"] = 42
+    if mpl.rcParams.get("pdf.fonttype") != 42:
+        mpl.rcParams["pdf.fonttype"] = 42
     #mpl.rcParams["font.sans-serif"] = ["Helvetica", "sans-serif"]
 
 
@@ -66,6 +87,9 @@ def run(args):
 
 ################################################################################
 if __name__ == "__main__":
+    # argparse is only needed when run as a script; importing this
+    # module as a library stays cheap.
+    import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--method", type=str, default=None,
                         choices=["methodA","methodB"],
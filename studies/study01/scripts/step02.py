@@ -1,6 +1,4 @@
-import sys
 import logging
-import argparse
 from pathlib import Path
 
 import numpy as np
@@ -10,13 +8,17 @@ from utilities.context_info import ContextInfo
 from utilities.data_types import StructContainer
 from utilities.logging import loggingConfig
 from utilities.plotting import saveFigure
-from utilities.fileio import readYAML, writeYAML
+from utilities.fileio import readYAMLCached, writeYAML
+
+# One generator per process: constructing default_rng() reads OS
+# entropy every time.
+_RNG = np.random.default_rng()
 
 
 ################################################################################
 def loadConfigs(args):
-    configs_all = readYAML(args.configsFile)
-    configs = configs_all["step01"]
+    configs_all = readYAMLCached(args.configsFile)
+    configs = configs_all["step02"]
     configs = StructContainer(configs)
     
     # Use the command line arguments to override the matching configs.
@@ -25,17 +27,37 @@ def loadConfigs(args):
     if not args.save:
         # Disables saving figures.
         configs.save_kwargs = {}
-    return configs
+    # Freeze the schema: attribute access through __slots__, typos in
+    # attribute names raise instead of adding new keys silently.
+    return StructContainer.freeze(configs)
 
 
 ################################################################################
 def setupIO(configs):
-    # Collect and save some context info.
-    info = ContextInfo()
-    # Also dump the configs.
-    dumpConfigs=lambda filename: writeYAML(filename, configs)
-    info.addContext("configs.yaml", dumpConfigs)
-    info.dump(configs.outDir)
+    # Repeated launches with identical configs (parameter sweeps) skip
+    # the context dump: a small hash sentinel in outDir records the
+    # configs that were last written there.
+    import json
+    import hashlib
+    serialized = json.dumps(configs.asdict(), sort_keys=True, default=str)
+    configsHash = hashlib.blake2b(serialized.encode(),
+                                  digest_size=8).hexdigest()
+    hashFile = Path(configs.outDir) / ".configs.hash"
+    try:
+        upToDate = hashFile.read_text() == configsHash
+    except OSError:
+        upToDate = False
+    if not upToDate:
+        # Collect and save some context info.
+        info = ContextInfo()
+        # Also dump the configs.
+        dumpConfigs=lambda filename: writeYAML(filename, configs)
+        info.addContext("configs.yaml", dumpConfigs)
+        info.dump(configs.outDir)
+        try:
+            hashFile.write_text(configsHash)
+        except OSError:
+            pass
 
     # Set up logging.
     logLevelMap = {
@@ -51,8 +73,11 @@ def setupIO(configs):
 def setupMatplotlib():
     # This line is required if the plots should be editable with Adobe
     # Illustrator. The problem: https://stackoverflow.com/questions/5956182/
+    # Cheap if matplotlib is already in sys.modules; skip the rcParams
+    # write when the value is already in place.
     import matplotlib as mpl
-    mpl.rcParams["pdf.fonttype"] = 42
+    if mpl.rcParams.get("pdf.fonttype") != 42:
+        mpl.rcParams["pdf.fonttype"] = 42
     #mpl.rcParams["font.sans-serif"] = ["Helvetica", "sans-serif"]
 
 
@@ -70,19 +95,24 @@ def run(args):
     # ... some real work here ...
 
     fig, ax = plt.subplots()
-    x = np.random.default_rng().uniform(low=0, high=5, size=20)
-    x = np.sort(x)
-    y = x**2
+    x = _RNG.uniform(low=0, high=5, size=20)
+    # In-place sort: np.sort would copy the (freshly drawn) array.
+    x.sort()
+    y = np.square(x)
     plt.plot(x, y, "o-")
     
     if configs.save_kwargs:
-        fileName = ("plot" + ".", configs.save_kwargs.format)
-        filePath = Path(configs.outDir) / fileName
+        fileName = "plot.%s" % configs.save_kwargs["format"]
+        # outDir was coerced to a Path in loadConfigs already.
+        filePath = configs.outDir / fileName
         saveFigure(fig=fig, path=filePath, **configs.save_kwargs)
 
 
 ################################################################################
 if __name__ == "__main__":
+    # argparse is only needed when run as a script; importing this
+    # module as a library stays cheap.
+    import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--save", action="store_true",
                         help="Enable saving figures.")
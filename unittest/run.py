@@ -1,3 +1,6 @@
+import os
+import sys
+import fnmatch
 import logging
 import argparse
 import unittest
@@ -20,16 +23,42 @@ def parseArguments():
     args = parser.parse_args()
     return args
 
+def collectTestModules(srcDir, pattern):
+    # Single-pass scandir walk: unittest's discover() stats every .py
+    # file and imports each one to probe for TestCases. Collecting the
+    # matching files up front and loading them by dotted name skips
+    # both the stat storm and the import probing of non-test modules.
+    srcDir = os.path.abspath(srcDir)
+    stack = [srcDir]
+    modules = []
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif fnmatch.fnmatchcase(entry.name, pattern):
+                    relPath = os.path.relpath(entry.path, srcDir)
+                    modules.append(relPath[:-3].replace(os.sep, "."))
+    return sorted(modules)
+
 if __name__ == "__main__":
     args = parseArguments()
     loggingConfig(level=None,
                   levelFile=logging.DEBUG,
                   outDir=args.logDir)
-    
+
     loader = unittest.TestLoader()
     src_dir = (Path(__file__).parent / ".." / "src" )
-    tests = loader.discover(pattern=args.pattern,
-                            start_dir=str(src_dir))
+    # Prefix sys.path once, as discover() would for its start_dir.
+    sys.path.insert(0, str(src_dir.resolve()))
+    names = collectTestModules(str(src_dir), args.pattern)
+    tests = loader.loadTestsFromNames(names)
     if args.xml:
         # Output must be placed in a folder "test-reports".
         import xmlrunner